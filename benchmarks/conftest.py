@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import fields, validators
+from bluejayson.legacy.schema import BaseSchema, SchemaMeta
+
+#: Number of fields of schemas under benchmark
+SCHEMA_WIDTHS = [5, 50, 500]
+
+
+def make_schema_dict(num_fields: int) -> dict:
+    """
+    Creates the class dict of a schema with the given number of fields
+    (mixing required fields, half of which have sanitizers, and defaulted fields).
+    """
+    dct = {}
+    for i in range(num_fields):
+        if i % 6 == 0:
+            dct[f'field_{i}'] = fields.IntField(sanitizer=validators.lower_bound(0))
+        elif i % 6 == 3:
+            dct[f'field_{i}'] = fields.IntField()
+        elif i % 3 == 1:
+            dct[f'field_{i}'] = fields.StrField(default="")
+        else:
+            dct[f'field_{i}'] = fields.ListField(int, default=list)
+    return dct
+
+
+def make_schema(num_fields: int) -> type:
+    return SchemaMeta(f'Schema{num_fields}', (BaseSchema,), make_schema_dict(num_fields))
+
+
+def make_params(num_fields: int) -> dict:
+    return {f'field_{i}': i for i in range(0, num_fields, 3)}
+
+
+@pytest.fixture(params=SCHEMA_WIDTHS, ids=lambda n: f'{n}_fields')
+def num_fields(request) -> int:
+    return request.param
+
+
+@pytest.fixture
+def schema_dict(num_fields) -> dict:
+    return make_schema_dict(num_fields)
+
+
+@pytest.fixture
+def schema(num_fields) -> type:
+    return make_schema(num_fields)
+
+
+@pytest.fixture
+def params(num_fields) -> dict:
+    return make_params(num_fields)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import functools
+
+import pytest
+
+from bluejayson.legacy import validators
+from bluejayson.legacy.sanitizers import Sanitizer
+
+#: Number of links of sanitizer chains under benchmark
+CHAIN_DEPTHS = [1, 10, 100]
+
+
+def make_chain(depth: int, link_factory) -> Sanitizer:
+    return functools.reduce(Sanitizer.concat, [link_factory(i) for i in range(depth)])
+
+
+@pytest.mark.benchmark(group='sanitizer-chain-validators')
+@pytest.mark.parametrize('depth', CHAIN_DEPTHS)
+def test_validator_chain(benchmark, depth):
+    chain = make_chain(depth, lambda i: validators.upper_bound(1000 + i))
+    assert benchmark(chain, 500) == 500
+
+
+@pytest.mark.benchmark(group='sanitizer-chain-identity')
+@pytest.mark.parametrize('depth', CHAIN_DEPTHS)
+def test_identity_chain(benchmark, depth):
+    chain = make_chain(depth, lambda i: Sanitizer())
+    assert benchmark(chain, 500) == 500
+
+
+@pytest.mark.benchmark(group='sanitizer-chain-build')
+@pytest.mark.parametrize('depth', CHAIN_DEPTHS)
+def test_chain_build(benchmark, depth):
+    links = [validators.upper_bound(1000 + i) for i in range(depth)]
+    benchmark(functools.reduce, Sanitizer.concat, links)
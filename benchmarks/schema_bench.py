@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy.schema import BaseSchema, SchemaMeta
+
+
+@pytest.mark.benchmark(group='schema-class-creation')
+def test_class_creation(benchmark, num_fields, schema_dict):
+    name = f'Schema{num_fields}'
+    benchmark(lambda: SchemaMeta(name, (BaseSchema,), dict(schema_dict)))
+
+
+@pytest.mark.benchmark(group='schema-construction')
+def test_construction(benchmark, schema, params):
+    benchmark(lambda: schema(**params))
+
+
+@pytest.mark.benchmark(group='schema-field-read')
+def test_field_read(benchmark, schema, params):
+    instance = schema(**params)
+    names = list(schema.bjs_all_fields)
+    benchmark(lambda: [getattr(instance, name) for name in names])
+
+
+@pytest.mark.benchmark(group='schema-field-write')
+def test_field_write(benchmark, schema, params):
+    instance = schema(**params)
+    names = list(params)
+    benchmark(lambda: [setattr(instance, name, 0) for name in names])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bluejayson.validators import Length, Range
+
+#: Number of threads sharing the same validators
+THREAD_COUNTS = [1, 2, 4, 8]
+
+#: Number of values validated by each thread per round
+VALUES_PER_THREAD = 20_000
+
+RANGE = Range(min=0, max=100)
+LENGTH = Length(min=1, max=8)
+NUMBERS = list(range(-50, 150)) * (VALUES_PER_THREAD // 200)
+STRINGS = ["", "blue", "bluejays", "mockingbird"] * (VALUES_PER_THREAD // 4)
+
+
+def validate_chunk(_):
+    return sum(map(RANGE, NUMBERS)) + sum(map(LENGTH, STRINGS))
+
+
+@pytest.mark.benchmark(group='threads-shared-validators')
+@pytest.mark.parametrize('num_threads', THREAD_COUNTS)
+def test_shared_validators(benchmark, num_threads):
+    """
+    Each thread validates the same amount of values with validators shared by
+    all threads; on a free-threaded build the round time should stay roughly
+    flat as threads are added (i.e. throughput scales with threads).
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    benchmark.extra_info['gil_enabled'] = is_gil_enabled
+    benchmark.extra_info['values_per_round'] = 2 * VALUES_PER_THREAD * num_threads
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        results = benchmark.pedantic(
+            lambda: list(executor.map(validate_chunk, range(num_threads))),
+            rounds=5, warmup_rounds=1,
+        )
+    assert len(set(results)) == 1
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.validators import Equal, Length, Predicate, Range, ValidationFailed
+
+#: Built-in validators with an accepted and a rejected input value each
+VALIDATOR_CASES = {
+    'predicate': (Predicate(lambda value: value > 0), 1, -1),
+    'equal': (Equal(42), 42, 0),
+    'range': (Range(min=0, max=100), 50, 500),
+    'range_incomparable': (Range(min=0, max=100), 50, "fifty"),
+    'length': (Length(min=1, max=8), "bluejay", "mockingbird"),
+}
+
+#: Fraction of rejected values in a batch
+REJECT_RATIOS = {'pass_heavy': 0.1, 'reject_heavy': 0.9}
+
+BATCH_SIZE = 1000
+
+
+def make_batch(case: str, ratio: str) -> list:
+    _, accepted, rejected = VALIDATOR_CASES[case]
+    num_rejected = int(BATCH_SIZE * REJECT_RATIOS[ratio])
+    return [rejected] * num_rejected + [accepted] * (BATCH_SIZE - num_rejected)
+
+
+def validate_or_false(validator, value) -> bool:
+    try:
+        return validator.validate(value)
+    except ValidationFailed:
+        return False
+
+
+@pytest.mark.benchmark(group='validator-call')
+@pytest.mark.parametrize('case', VALIDATOR_CASES)
+@pytest.mark.parametrize('outcome', ['accepted', 'rejected'])
+def test_call(benchmark, case, outcome):
+    validator, accepted, rejected = VALIDATOR_CASES[case]
+    value = accepted if outcome == 'accepted' else rejected
+    assert benchmark(validator, value) is (outcome == 'accepted')
+
+
+@pytest.mark.benchmark(group='validator-validate')
+@pytest.mark.parametrize('case', VALIDATOR_CASES)
+@pytest.mark.parametrize('outcome', ['accepted', 'rejected'])
+def test_validate(benchmark, case, outcome):
+    validator, accepted, rejected = VALIDATOR_CASES[case]
+    value = accepted if outcome == 'accepted' else rejected
+    assert benchmark(validate_or_false, validator, value) is (outcome == 'accepted')
+
+
+@pytest.mark.benchmark(group='validator-loop')
+@pytest.mark.parametrize('case', VALIDATOR_CASES)
+@pytest.mark.parametrize('ratio', REJECT_RATIOS)
+def test_call_loop(benchmark, case, ratio):
+    validator = VALIDATOR_CASES[case][0]
+    values = make_batch(case, ratio)
+    benchmark(lambda: [validator(value) for value in values])
+
+
+@pytest.mark.benchmark(group='validator-batch')
+@pytest.mark.parametrize('case', VALIDATOR_CASES)
+@pytest.mark.parametrize('ratio', REJECT_RATIOS)
+def test_validate_batch(benchmark, case, ratio):
+    validator = VALIDATOR_CASES[case][0]
+    values = make_batch(case, ratio)
+    benchmark(validator.validate_batch, values)
+
+
+@pytest.mark.benchmark(group='validator-construction')
+def test_predicate_construction(benchmark):
+    def positive(value, *, strict=True):
+        return value > 0
+
+    benchmark(Predicate, positive)
@@ -4,22 +4,45 @@ basic data serializations and validations, and it works with JSON data.
 """
 from __future__ import annotations
 
-import json
-import os
-
 __all__ = []
 
-this_dir = os.path.dirname(os.path.abspath(__file__))
-metadata_file = os.path.join(this_dir, 'meta.json')
+#: Module attributes which are read from package metadata on first access
+#: (so that importing the package performs no file I/O)
+_METADATA_ATTRIBUTES = {
+    '__author__': 'author',
+    '__version__': 'version',
+    '__status__': 'status',
+    '__license__': 'license',
+    '__maintainers__': 'maintainers',
+}
+
+#: Subpackages which are imported on first access
+_LAZY_SUBMODULES = ('validators', 'legacy')
+
+
+def __getattr__(name: str):
+    if name in _METADATA_ATTRIBUTES:
+        value = _read_metadata().get(_METADATA_ATTRIBUTES[name])
+    elif name in _LAZY_SUBMODULES:
+        import importlib
+        value = importlib.import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_METADATA_ATTRIBUTES, *_LAZY_SUBMODULES})
+
 
-try:
-    with open(metadata_file) as fobj:
-        metadata = json.load(fobj)
-except Exception:  # pragma: no cover
-    metadata = {}
+def _read_metadata() -> dict:
+    import json
+    import os
 
-__author__ = metadata.get('authoring')
-__version__ = metadata.get('version')
-__status__ = metadata.get('status')
-__license__ = metadata.get('license')
-__maintainers__ = metadata.get('maintainers')
+    metadata_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'meta.json')
+    try:
+        with open(metadata_file) as fobj:
+            return json.load(fobj)
+    except Exception:  # pragma: no cover
+        return {}
@@ -0,0 +1,277 @@
+"""
+Compact binary serialization of schema instances.
+
+Records are laid out in the fixed field order of `bjs_all_fields`
+without any field names on the wire:
+
+1. a bitmap marking which fields are `None`;
+2. a bitmap packing the values of all boolean fields;
+3. one little-endian signed 64-bit slot per integer field;
+4. the remaining fields in order, each as a 32-bit length followed by
+   UTF-8 text (for string fields) or compact JSON (for any other field;
+   tuples are stored as JSON arrays in fields whose default is a tuple).
+
+Values which would not decode back to equal values of the same types
+(such as dicts with non-string keys in JSON fields) are rejected
+with :exc:`TypeError` upon encoding. Schemas with defaults which could
+never be encoded are rejected as soon as their codec is created.
+
+A batch is a single buffer made of a header (magic bytes, schema fingerprint
+and record count), a table of record offsets, and the records themselves,
+so that each record can be decoded on its own without touching the others.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from typing import Any, Iterable, Iterator, List, Sequence, Type, Union
+
+from bluejayson.legacy import fields
+from bluejayson.legacy.fields import DefaultKind
+from bluejayson.legacy.schema import BaseSchema
+
+#: Magic bytes at the start of every batch
+BATCH_MAGIC = b'BJS1'
+
+_BATCH_HEADER = struct.Struct('<4sIQ')
+_OFFSET = struct.Struct('<Q')
+_LENGTH = struct.Struct('<I')
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class SchemaCodec:
+    """
+    Encodes and decodes instances of a schema class to and from compact bytes.
+
+    Attributes:
+        schema: Schema class whose instances are serialized.
+        field_names: Names of all fields in wire order.
+        fingerprint: Checksum of field names and their wire kinds which guards
+            against decoding batches encoded from a different schema.
+    """
+
+    def __init__(self, schema: Type[BaseSchema]):
+        self.schema = schema
+        self.field_names = tuple(schema.bjs_all_fields)
+        kinds = [_wire_kind(field) for field in schema.bjs_all_fields.values()]
+        self._kinds = kinds
+        self._bool_indices = [i for i, kind in enumerate(kinds) if kind == 'bool']
+        self._int_indices = [i for i, kind in enumerate(kinds) if kind == 'int']
+        self._var_indices = [i for i, kind in enumerate(kinds) if kind in ('str', 'json', 'tuple')]
+        self._null_size = (len(kinds) + 7) // 8
+        self._bool_size = (len(self._bool_indices) + 7) // 8
+        self._ints = struct.Struct(f'<{len(self._int_indices)}q')
+        signature = ';'.join(f'{name}:{kind}' for name, kind in zip(self.field_names, kinds))
+        self.fingerprint = zlib.crc32(signature.encode('utf-8'))
+
+        for (name, field), kind in zip(schema.bjs_all_fields.items(), kinds):
+            if field.default_kind in (DefaultKind.SHARED, DefaultKind.CONSTANT) and field.default is not None:
+                try:
+                    _check_value(name, kind, field.default)
+                except TypeError as exc:
+                    raise TypeError(f"{schema.__qualname__} cannot be encoded: default of {exc}") from exc
+
+    def encode(self, instance: BaseSchema) -> bytes:
+        """
+        Encodes a single schema instance into bytes.
+        """
+        values = [getattr(instance, name) for name in self.field_names]
+        nulls = bytearray(self._null_size)
+        for i, value in enumerate(values):
+            if value is None:
+                nulls[i >> 3] |= 1 << (i & 7)
+
+        bools = bytearray(self._bool_size)
+        for j, i in enumerate(self._bool_indices):
+            value = values[i]
+            if value is None:
+                continue
+            if not isinstance(value, bool):
+                raise TypeError(f"field {self.field_names[i]}: cannot pack {value!r} as boolean")
+            if value:
+                bools[j >> 3] |= 1 << (j & 7)
+
+        ints = []
+        for i in self._int_indices:
+            value = values[i]
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+                raise TypeError(f"field {self.field_names[i]}: cannot pack {value!r} as integer")
+            ints.append(0 if value is None else value)
+        try:
+            packed_ints = self._ints.pack(*ints)
+        except struct.error as exc:
+            raise OverflowError(f"integer fields must fit in 64 bits: {exc}") from exc
+
+        parts = [nulls, bools, packed_ints]
+        for i in self._var_indices:
+            value = values[i]
+            if value is None:
+                continue
+            _check_value(self.field_names[i], self._kinds[i], value)
+            if self._kinds[i] == 'str':
+                data = value.encode('utf-8')
+            else:
+                data = json.dumps(value, separators=(',', ':')).encode('utf-8')
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b''.join(parts)
+
+    def decode(self, data: Buffer) -> BaseSchema:
+        """
+        Decodes a single schema instance from bytes (field sanitizers are not run
+        again whereas schema validators are).
+        """
+        view = memoryview(data)
+        values: List[Any] = [None] * len(self.field_names)
+        nulls = view[:self._null_size]
+        position = self._null_size
+
+        bools = view[position:position + self._bool_size]
+        for j, i in enumerate(self._bool_indices):
+            if not nulls[i >> 3] & (1 << (i & 7)):
+                values[i] = bool(bools[j >> 3] & (1 << (j & 7)))
+        position += self._bool_size
+
+        for i, value in zip(self._int_indices, self._ints.unpack_from(view, position)):
+            if not nulls[i >> 3] & (1 << (i & 7)):
+                values[i] = value
+        position += self._ints.size
+
+        for i in self._var_indices:
+            if nulls[i >> 3] & (1 << (i & 7)):
+                continue
+            (length,) = _LENGTH.unpack_from(view, position)
+            position += _LENGTH.size
+            text = str(view[position:position + length], 'utf-8')
+            kind = self._kinds[i]
+            if kind == 'str':
+                values[i] = text
+            elif kind == 'tuple':
+                values[i] = tuple(json.loads(text))
+            else:
+                values[i] = json.loads(text)
+            position += length
+
+        return self.schema.bjs_construct(dict(zip(self.field_names, values)))
+
+    def encode_batch(self, instances: Iterable[BaseSchema]) -> bytes:
+        """
+        Encodes schema instances into a single contiguous batch buffer.
+        """
+        records = [self.encode(instance) for instance in instances]
+        table_size = (len(records) + 1) * _OFFSET.size
+        offset = _BATCH_HEADER.size + table_size
+        offsets = bytearray()
+        for record in records:
+            offsets += _OFFSET.pack(offset)
+            offset += len(record)
+        offsets += _OFFSET.pack(offset)
+        header = _BATCH_HEADER.pack(BATCH_MAGIC, self.fingerprint, len(records))
+        return b''.join([header, offsets, *records])
+
+    def decode_batch(self, buffer: Buffer) -> RecordBatch:
+        """
+        Wraps the batch buffer for lazy per-record decoding (without copying it).
+        """
+        return RecordBatch(self, buffer)
+
+
+class RecordBatch(Sequence):
+    """
+    Read-only sequence of schema instances backed by a batch buffer.
+    Each record is only decoded when it is accessed.
+    """
+
+    def __init__(self, codec: SchemaCodec, buffer: Buffer):
+        view = memoryview(buffer)
+        if len(view) < _BATCH_HEADER.size:
+            raise ValueError("buffer is too short to be a batch")
+        magic, fingerprint, count = _BATCH_HEADER.unpack_from(view)
+        if magic != BATCH_MAGIC:
+            raise ValueError("buffer does not start with a batch header")
+        if fingerprint != codec.fingerprint:
+            raise ValueError(f"batch was not encoded from {codec.schema.__qualname__}")
+        if len(view) < _BATCH_HEADER.size + (count + 1) * _OFFSET.size:
+            raise ValueError("buffer is too short for its offset table")
+        self.codec = codec
+        self._view = view
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> BaseSchema:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return self.codec.decode(self.record_bytes(index))
+
+    def __iter__(self) -> Iterator[BaseSchema]:
+        for index in range(self._count):
+            yield self[index]
+
+    def record_bytes(self, index: int) -> memoryview:
+        """
+        Returns the encoded bytes of a single record (as a view into the buffer).
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        position = _BATCH_HEADER.size + index * _OFFSET.size
+        (start,) = _OFFSET.unpack_from(self._view, position)
+        (end,) = _OFFSET.unpack_from(self._view, position + _OFFSET.size)
+        return self._view[start:end]
+
+
+def _wire_kind(field: fields.BaseField) -> str:
+    if isinstance(field, fields.BoolField):
+        return 'bool'
+    if isinstance(field, fields.IntField):
+        return 'int'
+    if isinstance(field, fields.StrField):
+        return 'str'
+    if isinstance(field.default, tuple):
+        return 'tuple'
+    return 'json'
+
+
+def _check_value(name: str, kind: str, value: Any):
+    """
+    Raises :exc:`TypeError` if the (non-null) value cannot be encoded as the given wire kind.
+    """
+    if kind == 'bool':
+        if not isinstance(value, bool):
+            raise TypeError(f"field {name}: cannot pack {value!r} as boolean")
+    elif kind == 'int':
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"field {name}: cannot pack {value!r} as integer")
+    elif kind == 'str':
+        if not isinstance(value, str):
+            raise TypeError(f"field {name}: cannot pack {value!r} as string")
+    elif kind == 'tuple':
+        if not isinstance(value, tuple):
+            raise TypeError(f"field {name}: cannot pack {value!r} as tuple")
+        for item in value:
+            _check_json(name, item)
+    else:
+        _check_json(name, value)
+
+
+def _check_json(name: str, value: Any):
+    """
+    Raises :exc:`TypeError` if the value would not survive a JSON round trip unchanged.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return
+    if isinstance(value, list):
+        for item in value:
+            _check_json(name, item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"field {name}: cannot pack non-string key {key!r} as JSON")
+            _check_json(name, item)
+    else:
+        raise TypeError(f"field {name}: cannot pack {value!r} as JSON")
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Type
+
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.sanitizers import and_masks
+from bluejayson.legacy.schema import BaseSchema
+from bluejayson.validators import _numpy_for
+
+#: Key of :py:attr:`ColumnarResult.errors` under which failures of schema validators are kept
+SCHEMA_ERRORS = '__schema__'
+
+
+@dataclass
+class ColumnarResult:
+    """
+    Outcome of validating a batch of rows in columnar form
+    (see :py:func:`validate_columns`).
+
+    Attributes:
+        schema: Schema class whose fields validated the columns.
+        columns: Mapping from field names to sanitized columns.
+        valid: Row-validity mask (`True` for rows passing all field sanitizers and
+            schema validators); a boolean NumPy array if any column was checked vectorially.
+        errors: Mapping from field names (and :py:data:`SCHEMA_ERRORS` for schema validators)
+            to mappings from indices of failing rows to their error messages.
+    """
+    schema: Type[BaseSchema]
+    columns: Dict[str, Sequence]
+    valid: Sequence[bool]
+    errors: Dict[str, Dict[int, str]]
+
+    def __len__(self):
+        return len(self.valid)
+
+    def invalid_rows(self) -> List[int]:
+        """
+        Returns indices of all rows failing at least one field sanitizer or schema validator.
+        """
+        return _row_indices(self.valid, False)
+
+    def row_errors(self, index: int) -> Dict[str, str]:
+        """
+        Returns the mapping from field names to error messages of the given row.
+        """
+        return {name: errors[index] for name, errors in self.errors.items() if index in errors}
+
+    def instance(self, index: int) -> BaseSchema:
+        """
+        Materializes the schema instance of the given row (without re-running
+        field sanitizers). Schema validators of the schema are run at this point.
+        """
+        return self.schema.bjs_construct(_row_values(self.columns, index))
+
+    def instances(self) -> Iterator[BaseSchema]:
+        """
+        Lazily materializes schema instances of all valid rows.
+        """
+        for index in _row_indices(self.valid, True):
+            yield self.instance(index)
+
+
+def validate_columns(schema: Type[BaseSchema], columns: Dict[str, Sequence]) -> ColumnarResult:
+    """
+    Validates a batch of rows given as columns (struct-of-arrays) without creating
+    one schema instance per row. Each field sanitizer is applied column-at-a-time,
+    taking the batch path of validators from :py:mod:`bluejayson.validators`
+    whenever the sanitizer knows its equivalent constraint. Schema validators
+    are then run on each row which passes all field sanitizers.
+
+    Args:
+        schema: Schema class to validate the columns against
+        columns: Mapping from field names to columns of equal length
+            (either lists or NumPy arrays)
+
+    Returns:
+        An instance of :py:class:`ColumnarResult`.
+    """
+    all_fields = schema.bjs_all_fields
+    for name in columns.keys():
+        if name not in all_fields.keys():
+            raise TypeError(f"unknown field {name}")
+    for name in sorted(schema.bjs_required_fields):
+        if name not in columns:
+            raise TypeError(f"missing column for required field {name}")
+
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns have mismatched lengths {sorted(lengths)}")
+    num_rows = lengths.pop() if lengths else 0
+
+    sanitized = {}
+    errors = {}
+    valid = None
+    for name, column in columns.items():
+        sanitizer = all_fields[name].sanitizer
+        if sanitizer.is_identity:
+            sanitized[name] = column
+            continue
+        sanitized[name], mask, errors[name] = sanitizer.sanitize_column(column)
+        valid = mask if valid is None else and_masks(valid, mask)
+    if valid is None:
+        valid = [True] * num_rows
+
+    validators = tuple(schema.bjs_all_validators.values())
+    if validators:
+        schema_errors = errors[SCHEMA_ERRORS] = {}
+        for index in _row_indices(valid, True):
+            instance = schema.__new__(schema)
+            instance.__dict__.update(_row_values(sanitized, index))
+            try:
+                instance.bjs_run_validators(validators)
+            except ValidationError as e:
+                schema_errors[index] = e.args[0]
+                valid[index] = False
+
+    return ColumnarResult(schema=schema, columns=sanitized, valid=valid, errors=errors)
+
+
+def _row_indices(mask: Sequence[bool], ok: bool) -> List[int]:
+    """
+    Returns indices of all rows whose mask entry equals `ok`.
+    """
+    np = _numpy_for(mask)
+    if np is not None:
+        return np.flatnonzero(mask if ok else ~mask).tolist()
+    return [index for index, row_ok in enumerate(mask) if bool(row_ok) is ok]
+
+
+def _row_values(columns: Dict[str, Sequence], index: int) -> Dict[str, Any]:
+    return {name: _python_value(column[index]) for name, column in columns.items()}
+
+
+def _python_value(value: Any) -> Any:
+    """
+    Converts NumPy scalars (obtained by indexing NumPy arrays) into Python values.
+    """
+    if type(value).__module__ == 'numpy' and hasattr(value, 'item'):
+        return value.item()
+    return value
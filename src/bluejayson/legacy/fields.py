@@ -1,17 +1,56 @@
 from __future__ import annotations
 
-from typing import Optional, Type
+import enum
+from typing import Any, Callable, Optional, TYPE_CHECKING, Type
 
-from bluejayson.legacy.formatters import Formatter
-from bluejayson.legacy.parsers import Parser
-from bluejayson.legacy.sanitizers import Sanitizer
-from bluejayson.legacy.schema import BaseSchema
+from bluejayson import profiling
+from bluejayson.legacy.formatters import Formatter, IDENTITY_FORMATTER
+from bluejayson.legacy.parsers import IDENTITY_PARSER, Parser
+from bluejayson.legacy.sanitizers import IDENTITY_SANITIZER, Sanitizer
+
+if TYPE_CHECKING:
+    from bluejayson.legacy.schema import BaseSchema
 
 
 class _Empty:
     pass
 
 
+#: Types of values which are never mutated in place
+#: and thus can be shared by all schema instances as defaults
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, frozenset, range, enum.Enum)
+
+
+class DefaultKind(enum.Enum):
+    """
+    Classification of field defaults which determines how they are materialized.
+    """
+    #: No default is given (the field is required)
+    EMPTY = 'empty'
+    #: Immutable value which is shared by all instances without being stored in them
+    SHARED = 'shared'
+    #: Other value which is stored into the instance on first read
+    CONSTANT = 'constant'
+    #: Callable which is invoked to create the value on first read
+    FACTORY = 'factory'
+
+    @classmethod
+    def of(cls, default) -> DefaultKind:
+        if default is _Empty:
+            return cls.EMPTY
+        if callable(default):
+            return cls.FACTORY
+        if _is_immutable(default):
+            return cls.SHARED
+        return cls.CONSTANT
+
+
+def _is_immutable(value) -> bool:
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
 class BaseField:
     """
     Constructs a field in the schema definition with appropriate parsers,
@@ -27,9 +66,19 @@ class BaseField:
         formatter: Instance of :py:class:`Formatter` class which does the
             opposite job of parsers: to convert value back into JSON strings
             or JSON-structured objects.
+        sanitize_value: Fastest callable equivalent to the sanitizer,
+            or `None` if the sanitizer leaves every value untouched.
+        has_dependents: Whether any schema validator depends on this field
+            (determined by :py:class:`SchemaMeta` at class creation).
+        default_kind: How the default value is materialized
+            (determined by :py:class:`SchemaMeta` at class creation).
     """
     empty = _Empty
 
+    sanitize_value: Optional[Callable[[Any], Any]]
+    has_dependents: bool = False
+    default_kind: DefaultKind = DefaultKind.EMPTY
+
     def __init__(
             self,
             default=_Empty,
@@ -38,23 +87,68 @@ class BaseField:
             formatter: Formatter = None,
     ):
         self.default = default
-        self.parser = parser or Parser()
-        self.sanitizer = sanitizer or Sanitizer()
-        self.formatter = formatter or Formatter()
+        self.parser = parser or IDENTITY_PARSER
+        self.sanitizer = sanitizer or IDENTITY_SANITIZER
+        self.formatter = formatter or IDENTITY_FORMATTER
+
+    @property
+    def sanitizer(self) -> Sanitizer:
+        return self._sanitizer
+
+    @sanitizer.setter
+    def sanitizer(self, sanitizer: Sanitizer):
+        self._sanitizer = sanitizer
+        self.sanitize_value = None if sanitizer.is_identity else sanitizer.as_function()
 
     def __set_name__(self, owner: Type[BaseSchema], name: str):
         self.field_name = name
 
     def __set__(self, instance: BaseSchema, value):
-        value = self.sanitizer(value)
+        if self.sanitize_value is not None:
+            value = self.sanitize_value(value)
+        if self.has_dependents:
+            validators = type(instance).bjs_field_dependents.get(self.field_name)
+            if validators:
+                instance.bjs_commit({self.field_name: value}, validators)
+                return
         instance.__dict__[self.field_name] = value
 
     def __get__(self, instance: Optional[BaseSchema], owner: Type[BaseSchema]):
         if instance is None:
             return self
-        if self.field_name not in instance.__dict__ and self.default is not BaseField.empty:
-            instance.__dict__[self.field_name] = self.default() if callable(self.default) else self.default
-        return instance.__dict__[self.field_name]
+        value = instance.__dict__.get(self.field_name, _Empty)
+        if value is not _Empty:
+            return value
+        return self.get_default(instance)
+
+    def get_default(self, instance: BaseSchema):
+        """
+        Materializes the default value for the instance which has not set this field.
+        Shared defaults are not stored into the instance.
+        """
+        profiler = profiling.active
+        if profiler is not None:
+            sample = profiler.current()
+            if sample is not None:
+                frame = sample.frame(f"default:{profiling.frame_name(self.field_name)}")
+                try:
+                    return self._materialize_default(instance)
+                finally:
+                    frame.finish()
+        return self._materialize_default(instance)
+
+    def _materialize_default(self, instance: BaseSchema):
+        kind = self.default_kind
+        if kind is DefaultKind.SHARED:
+            return self.default
+        if kind is DefaultKind.FACTORY:
+            value = self.default()
+        elif kind is DefaultKind.CONSTANT:
+            value = self.default
+        else:
+            raise AttributeError(f"field {self.field_name} has no value")
+        # Concurrent first reads all end up with whichever value is stored first
+        return instance.__dict__.setdefault(self.field_name, value)
 
 
 class StrField(BaseField):
@@ -3,3 +3,7 @@ from __future__ import annotations
 
 class Formatter:
     pass
+
+
+#: Shared formatter used by fields which are not given any formatter
+IDENTITY_FORMATTER = Formatter()
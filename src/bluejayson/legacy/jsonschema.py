@@ -0,0 +1,461 @@
+"""
+Conversion between schema classes and JSON Schema documents.
+
+Schema classes are exported from their fields and the validators
+attached to field sanitizers. JSON Schema documents are imported by
+generating the source code of an equivalent schema module, which may be
+cached on disk (keyed by the content hash of the document) so that
+unchanged documents are never recompiled.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import keyword
+import os
+import re
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from bluejayson.legacy import fields
+from bluejayson.legacy.fields import BaseField, DefaultKind
+from bluejayson.legacy.sanitizers import SanitizerChain
+from bluejayson.legacy.schema import BaseSchema
+from bluejayson.legacy.validators import Validator
+from bluejayson.validators import Equal, Length, Range
+
+#: JSON Schema dialect of exported documents
+DIALECT = 'https://json-schema.org/draft/2020-12/schema'
+
+#: Version of the generated source code (part of the cache key)
+CODEGEN_VERSION = 2
+
+#: JSON types of field classes
+FIELD_TYPES = [
+    (fields.StrField, 'string'),
+    (fields.IntField, 'integer'),
+    (fields.BoolField, 'boolean'),
+    (fields.ListField, 'array'),
+    (fields.DictField, 'object'),
+]
+
+#: JSON types of Python types (used for item types of list and dict fields)
+PYTHON_TYPES = {
+    str: 'string',
+    int: 'integer',
+    float: 'number',
+    bool: 'boolean',
+    list: 'array',
+    dict: 'object',
+}
+
+#: Checks of whether a Python value is an instance of each JSON type
+JSON_TYPE_CHECKS = {
+    'null': lambda value: value is None,
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': lambda value: isinstance(value, int) and not isinstance(value, bool),
+    'number': lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    'string': lambda value: isinstance(value, str),
+    'array': lambda value: isinstance(value, list),
+    'object': lambda value: isinstance(value, dict),
+}
+
+#: Keywords limiting the length of each JSON type
+LENGTH_KEYWORDS = {
+    'string': ('minLength', 'maxLength'),
+    'array': ('minItems', 'maxItems'),
+    'object': ('minProperties', 'maxProperties'),
+}
+
+#: Keywords which are accepted but carry no validation
+ANNOTATION_KEYWORDS = {
+    '$schema', '$id', '$comment', 'title', 'description', 'default',
+    'examples', 'format', 'readOnly', 'writeOnly', 'deprecated',
+}
+
+
+#####################
+# Exporting schemas #
+#####################
+
+
+def export_json_schema(schema: Type[BaseSchema]) -> Dict[str, Any]:
+    """
+    Exports the schema class as a JSON Schema document. Field constraints are
+    derived from validators (from :py:mod:`bluejayson.validators` or the legacy
+    factory functions) in field sanitizers; other kinds of checks, including
+    schema validators, cannot be expressed and are left out.
+
+    Args:
+        schema: Schema class to export
+
+    Returns:
+        JSON Schema document as a JSON-structured object.
+    """
+    properties = {
+        name: export_field(field)
+        for name, field in schema.bjs_all_fields.items()
+    }
+    return {
+        '$schema': DIALECT,
+        'title': schema.__qualname__,
+        'type': 'object',
+        'properties': properties,
+        'required': [name for name in schema.bjs_all_fields if name in schema.bjs_required_fields],
+        'additionalProperties': False,
+    }
+
+
+def export_field(field: BaseField) -> Dict[str, Any]:
+    """
+    Exports a single field as a JSON Schema (sub-)document.
+    """
+    json_type = _field_json_type(field)
+    document: Dict[str, Any] = {} if json_type is None else {'type': json_type}
+    if json_type == 'array' and field.val_type in PYTHON_TYPES:
+        document['items'] = {'type': PYTHON_TYPES[field.val_type]}
+    if json_type == 'object' and field.val_type in PYTHON_TYPES:
+        document['additionalProperties'] = {'type': PYTHON_TYPES[field.val_type]}
+
+    extra_constraints = []
+    for constraint in _field_constraints(field):
+        keywords = _export_constraint(constraint, json_type)
+        if any(name in document for name in keywords):
+            extra_constraints.append(keywords)
+        else:
+            document.update(keywords)
+    if extra_constraints:
+        document['allOf'] = extra_constraints
+
+    if field.default_kind in (DefaultKind.SHARED, DefaultKind.CONSTANT):
+        default = field.default
+    elif field.default_kind is DefaultKind.FACTORY:
+        default = field.default()
+    else:
+        return document
+    if _is_json(default):
+        document['default'] = default
+    return document
+
+
+def _field_json_type(field: BaseField) -> Optional[str]:
+    for field_cls, json_type in FIELD_TYPES:
+        if isinstance(field, field_cls):
+            return json_type
+    return None
+
+
+def _field_constraints(field: BaseField):
+    sanitizer = field.sanitizer
+    links = sanitizer.chain if isinstance(sanitizer, SanitizerChain) else (sanitizer,)
+    for link in links:
+        if isinstance(link, Validator) and link.constraint is not None:
+            yield link.constraint
+
+
+def _export_constraint(constraint, json_type: Optional[str]) -> Dict[str, Any]:
+    keywords = {}
+    if isinstance(constraint, Range):
+        if _is_number(constraint.min):
+            keywords['minimum' if constraint.min_inclusive else 'exclusiveMinimum'] = constraint.min
+        if _is_number(constraint.max):
+            keywords['maximum' if constraint.max_inclusive else 'exclusiveMaximum'] = constraint.max
+    elif isinstance(constraint, Length) and json_type in LENGTH_KEYWORDS:
+        min_keyword, max_keyword = LENGTH_KEYWORDS[json_type]
+        if constraint.min is not None:
+            keywords[min_keyword] = constraint.min
+        if constraint.max is not None:
+            keywords[max_keyword] = constraint.max
+    elif isinstance(constraint, Equal) and _is_json(constraint.target):
+        keywords['const'] = constraint.target
+    return keywords
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_json(value) -> bool:
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+#####################
+# Importing schemas #
+#####################
+
+
+def compile_json_schema(document: Dict[str, Any]) -> str:
+    """
+    Generates the source code of a Python module defining a schema class
+    equivalent to the given JSON Schema document (bound to the name `SCHEMA`).
+    Only flat object schemas are supported; keywords which cannot be
+    expressed by fields and validators raise :exc:`ValueError`.
+    Unknown fields are always rejected (as with `additionalProperties: false`).
+
+    Args:
+        document: JSON Schema document as a JSON-structured object
+
+    Returns:
+        Source code of the generated module.
+    """
+    _check_keywords(document, {'type', 'properties', 'required', 'additionalProperties'}, '')
+    if document.get('type', 'object') != 'object':
+        raise ValueError("only object schemas can be compiled into schema classes")
+
+    if document.get('additionalProperties', False) is not False:
+        raise ValueError("only additionalProperties: false is supported")
+
+    class_name = _identifier(document.get('title', 'Schema'), 'Schema')
+    properties = document.get('properties', {})
+    required = set(document.get('required', []))
+    unknown = required.difference(properties)
+    if unknown:
+        raise ValueError(f"required properties {', '.join(sorted(unknown))} are not defined")
+    lines = [
+        f"# Generated by bluejayson from JSON Schema (codegen version {CODEGEN_VERSION})",
+        "from bluejayson.legacy import fields, validators",
+        "from bluejayson.legacy.jsonschema import has_json_items, is_json_type",
+        "from bluejayson.legacy.schema import BaseSchema",
+        "",
+        "",
+        f"class {class_name}(BaseSchema):",
+    ]
+    for name, subdocument in properties.items():
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('bjs_'):
+            raise ValueError(f"property {name!r} cannot be used as a field name")
+        lines.append(f"    {name} = {_compile_field(name, subdocument, name in required)}")
+    if not properties:
+        lines.append("    pass")
+    lines.extend(["", "", f"SCHEMA = {class_name}", ""])
+    return '\n'.join(lines)
+
+
+#: Keywords which are compiled into validators
+CONSTRAINT_KEYWORDS = {
+    'const', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+    'minLength', 'maxLength', 'minItems', 'maxItems', 'minProperties', 'maxProperties',
+}
+
+
+def _compile_field(name: str, document: Dict[str, Any], required: bool) -> str:
+    prefix = f"property {name!r}: "
+    if document is True:
+        document = {}
+    elif document is False:
+        raise ValueError(f"{prefix}false subschemas (which reject every value) are not supported")
+    elif not isinstance(document, dict):
+        raise ValueError(f"{prefix}subschema must be an object or a boolean")
+    _check_keywords(document, {'type', 'items', 'additionalProperties', 'allOf'} | CONSTRAINT_KEYWORDS,
+                    prefix)
+    type_names = _type_names(prefix, document)
+    non_null_types = [type_name for type_name in type_names if type_name != 'null']
+    json_type = non_null_types[0] if len(non_null_types) == 1 else None
+    sanitizers = [f"is_json_type({', '.join(map(repr, type_names))})"] if type_names else []
+    arguments = []
+    if json_type == 'array':
+        field_expr = 'fields.ListField'
+        arguments.append(_compile_items(prefix, document.get('items', True), sanitizers))
+    elif json_type == 'object':
+        field_expr = 'fields.DictField'
+        arguments.append(_compile_items(prefix, document.get('additionalProperties', True), sanitizers))
+    else:
+        field_expr = next((f'fields.{field_cls.__name__}' for field_cls, field_type in FIELD_TYPES
+                           if field_type == json_type), 'fields.BaseField')
+
+    if 'default' in document:
+        default = document['default']
+        arguments.append(f"default=lambda: {default!r}" if isinstance(default, (list, dict))
+                         else f"default={default!r}")
+    elif not required:
+        arguments.append("default=None")
+
+    sanitizers.extend(_compile_validators(name, document))
+    for subdocument in document.get('allOf', []):
+        if subdocument is True:
+            continue
+        if not isinstance(subdocument, dict):
+            raise ValueError(f"{prefix}only object subschemas (or true) are supported in allOf")
+        _check_keywords(subdocument, CONSTRAINT_KEYWORDS, prefix)
+        sanitizers.extend(_compile_validators(name, subdocument))
+    if sanitizers:
+        arguments.append(f"sanitizer={' @ '.join(sanitizers)}")
+    return f"{field_expr}({', '.join(arguments)})"
+
+
+def _compile_validators(name: str, document: Dict[str, Any]) -> List[str]:
+    sanitizers = []
+
+    lower = _bound(name, document, 'minimum', 'exclusiveMinimum')
+    upper = _bound(name, document, 'maximum', 'exclusiveMaximum')
+    if lower and upper:
+        (lower_limit, lower_inclusive), (upper_limit, upper_inclusive) = lower, upper
+        flags = ''
+        if not (lower_inclusive and upper_inclusive):
+            flags = f", lower_inclusive={lower_inclusive}, upper_inclusive={upper_inclusive}"
+        sanitizers.append(f"validators.between({lower_limit!r}, {upper_limit!r}{flags})")
+    elif lower or upper:
+        factory = 'lower_bound' if lower else 'upper_bound'
+        limit, inclusive = lower or upper
+        flags = '' if inclusive else ', inclusive=False'
+        sanitizers.append(f"validators.{factory}({limit!r}{flags})")
+
+    for min_keyword, max_keyword in LENGTH_KEYWORDS.values():
+        min_length, max_length = document.get(min_keyword), document.get(max_keyword)
+        for length_keyword, length in [(min_keyword, min_length), (max_keyword, max_length)]:
+            if length is not None and not (type(length) is int and length >= 0):
+                raise ValueError(f"property {name!r}: {length_keyword} must be a non-negative integer")
+        if min_length is not None and max_length is not None:
+            sanitizers.append(f"validators.length_between({min_length!r}, {max_length!r})")
+        elif min_length is not None:
+            sanitizers.append(f"validators.min_length({min_length!r})")
+        elif max_length is not None:
+            sanitizers.append(f"validators.max_length({max_length!r})")
+
+    if 'const' in document:
+        sanitizers.append(f"validators.is_exactly({document['const']!r})")
+    return sanitizers
+
+
+def _bound(name: str, document: Dict[str, Any],
+           inclusive_keyword: str, exclusive_keyword: str) -> Optional[Tuple[Any, bool]]:
+    if inclusive_keyword in document and exclusive_keyword in document:
+        raise ValueError(f"property {name!r}: both {inclusive_keyword} "
+                         f"and {exclusive_keyword} are given")
+    for bound_keyword, inclusive in [(inclusive_keyword, True), (exclusive_keyword, False)]:
+        if bound_keyword in document:
+            if not _is_number(document[bound_keyword]):
+                raise ValueError(f"property {name!r}: {bound_keyword} must be a number")
+            return document[bound_keyword], inclusive
+    return None
+
+
+def _type_names(prefix: str, document: Dict[str, Any]) -> List[str]:
+    type_names = document.get('type', [])
+    if isinstance(type_names, str):
+        type_names = [type_names]
+    for type_name in type_names:
+        if type_name not in JSON_TYPE_CHECKS:
+            raise ValueError(f"{prefix}unknown type {type_name!r}")
+    return list(type_names)
+
+
+def _compile_items(prefix: str, document, sanitizers: List[str]) -> str:
+    """
+    Returns the item type of a list or dict field given the schema of its items
+    (also adding the check of item types to the sanitizers).
+    """
+    if document is True:
+        return 'object'
+    if not isinstance(document, dict):
+        raise ValueError(f"{prefix}only schemas of items are supported")
+    _check_keywords(document, {'type'}, f"{prefix}items: ")
+    type_names = _type_names(prefix, document)
+    if not type_names:
+        return 'object'
+    sanitizers.append(f"has_json_items({', '.join(map(repr, type_names))})")
+    if len(type_names) == 1:
+        for python_type, type_name in PYTHON_TYPES.items():
+            if type_name == type_names[0]:
+                return python_type.__name__
+    return 'object'
+
+
+def is_json_type(*type_names: str) -> Validator:
+    """
+    Constructs a validator to check whether a value is an instance of any of
+    the given JSON types (used by schema classes compiled from JSON Schema).
+
+    Args:
+        type_names: Names of JSON types (such as `'integer'` or `'null'`)
+
+    Returns:
+        An instance of :py:class:`Validator`.
+    """
+    return Validator(_json_type_check(type_names), f"should be of type {' or '.join(type_names)}")
+
+
+def has_json_items(*type_names: str) -> Validator:
+    """
+    Constructs a validator to check whether all items of a list (or all values
+    of a dict) are instances of any of the given JSON types.
+
+    Args:
+        type_names: Names of JSON types (such as `'integer'` or `'null'`)
+
+    Returns:
+        An instance of :py:class:`Validator`.
+    """
+    check = _json_type_check(type_names)
+    return Validator(
+        lambda value: all(map(check, value.values() if isinstance(value, dict) else value)),
+        f"items should be of type {' or '.join(type_names)}",
+    )
+
+
+def _json_type_check(type_names) -> Callable[[Any], bool]:
+    checks = [JSON_TYPE_CHECKS[type_name] for type_name in type_names]
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: any(check(value) for check in checks)
+
+
+def _check_keywords(document: Dict[str, Any], supported: set, prefix: str):
+    unsupported = set(document.keys()) - supported - ANNOTATION_KEYWORDS
+    if unsupported:
+        raise ValueError(f"{prefix}unsupported keywords {', '.join(sorted(unsupported))}")
+
+
+def _identifier(title: str, fallback: str) -> str:
+    name = ''.join(word[:1].upper() + word[1:] for word in re.split(r'\W+', str(title)))
+    if not name.isidentifier() or keyword.iskeyword(name):
+        return fallback
+    return name
+
+
+def json_schema_digest(document: Dict[str, Any]) -> str:
+    """
+    Computes the content hash of the JSON Schema document
+    (independent of key ordering and whitespace).
+    """
+    canonical = json.dumps(document, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(f'{CODEGEN_VERSION}:{canonical}'.encode('utf-8')).hexdigest()
+
+
+def load_json_schema(document: Dict[str, Any], cache_dir: Optional[str] = None) -> Type[BaseSchema]:
+    """
+    Turns the JSON Schema document into a schema class.
+
+    Args:
+        document: JSON Schema document as a JSON-structured object
+        cache_dir: Directory in which generated modules are cached
+            (named after the content hash of the document); the module is
+            only generated if it is not already in the directory
+
+    Returns:
+        Schema class equivalent to the document.
+    """
+    digest = json_schema_digest(document)
+    module_name = f'bjs_schema_{digest[:32]}'
+
+    if cache_dir is None:
+        module = types.ModuleType(module_name)
+        exec(compile(compile_json_schema(document), module_name, 'exec'), module.__dict__)
+        return module.SCHEMA
+
+    path = os.path.join(cache_dir, f'{module_name}.py')
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as fobj:
+            fobj.write(compile_json_schema(document))
+        os.replace(temp_path, path)
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SCHEMA
@@ -3,3 +3,7 @@ from __future__ import annotations
 
 class Parser:
     pass
+
+
+#: Shared parser used by fields which are not given any parser
+IDENTITY_PARSER = Parser()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from bluejayson.legacy.exceptions import SanitizationError, ValidationError
+from bluejayson.validators import _numpy_for
 
 
 class Sanitizer:
@@ -26,6 +29,64 @@ class Sanitizer:
         """Alias for :py:meth:`sanitize` method."""
         return self.sanitize(value)
 
+    @property
+    def is_identity(self) -> bool:
+        """
+        Whether this sanitizer returns every value untouched without any checks.
+        """
+        return type(self).sanitize is Sanitizer.sanitize
+
+    def as_function(self) -> Callable[[Any], Any]:
+        """
+        Returns the fastest callable equivalent to :py:meth:`sanitize` method.
+        """
+        return self.sanitize
+
+    def pure_check(self) -> Optional[Tuple[Callable[[Any], bool], str]]:
+        """
+        Returns the pair of predicate and error message if this sanitizer only checks
+        the value (raising :exc:`ValidationError` with the message when the predicate
+        does not hold) without altering it. Otherwise returns `None`.
+        Sanitizer chains use this to inline such checks.
+        """
+        return None
+
+    def inline_check(self, prefix: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns a Python expression over `value` equivalent to the predicate of
+        :py:meth:`pure_check` together with the namespace of names it refers to
+        (all of which start with `prefix`) if there is one. Otherwise returns `None`.
+        Sanitizer chains use this to compile such checks into literal comparisons.
+        """
+        return None
+
+    def sanitize_column(self, values: Sequence) -> Tuple[Sequence, Sequence[bool], Dict[int, str]]:
+        """
+        Column-at-a-time counterpart of :py:meth:`sanitize` method.
+
+        Args:
+            values: Sequence of values (such as a list or a NumPy array)
+
+        Returns:
+            Triple of the sanitized column, the validity mask (a boolean NumPy array
+            when the sanitizer checks a NumPy array vectorially, otherwise a list)
+            and the mapping from indices of failing values to their error messages.
+        """
+        if type(self).sanitize is Sanitizer.sanitize:
+            return values, [True] * len(values), {}
+        sanitized = []
+        mask = []
+        errors = {}
+        for index, value in enumerate(values):
+            try:
+                sanitized.append(self.sanitize(value))
+                mask.append(True)
+            except SanitizationError as e:
+                sanitized.append(value)
+                mask.append(False)
+                errors[index] = str(e)
+        return sanitized, mask, errors
+
     @staticmethod
     def concat(left_sanitizer: Union['Sanitizer', 'SanitizerChain'],
                right_sanitizer: Union['Sanitizer', 'SanitizerChain']):
@@ -65,12 +126,128 @@ class SanitizerChain(Sanitizer):
 
     Attributes:
         chain: A sequence of sanitizers.
+        fused: A single function equivalent to running all sanitizers of the chain,
+            compiled when the chain is created.
     """
 
-    def __init__(self, chain: List[Sanitizer]):
-        self.chain = chain
+    def __init__(self, chain: Iterable[Sanitizer]):
+        flattened = []
+        for sanitizer in chain:
+            if isinstance(sanitizer, SanitizerChain):
+                flattened.extend(sanitizer.chain)
+            else:
+                flattened.append(sanitizer)
+        self.chain: Tuple[Sanitizer, ...] = tuple(flattened)
+        self.fused = _fuse_chain(self.chain)
 
     def sanitize(self, value):
+        return self.fused(value)
+
+    def __call__(self, value):
+        return self.fused(value)
+
+    @property
+    def is_identity(self) -> bool:
+        return all(sanitizer.is_identity for sanitizer in self.chain)
+
+    def as_function(self) -> Callable[[Any], Any]:
+        return self.fused
+
+    def sanitize_column(self, values: Sequence) -> Tuple[Sequence, Sequence[bool], Dict[int, str]]:
+        """
+        Runs each sanitizer of the chain over the column in turn.
+        Values rejected by a sanitizer are not passed to the later ones
+        (just as with :py:meth:`sanitize` method) and keep the error they ran into.
+        """
+        mask = None
+        errors = {}
         for sanitizer in self.chain:
-            value = sanitizer.sanitize(value)
-        return value
+            if sanitizer.is_identity:
+                continue
+            if not errors:
+                values, link_mask, errors = sanitizer.sanitize_column(values)
+                mask = link_mask
+                continue
+            rows = _valid_rows(mask)
+            np = _numpy_for(values)
+            subset = values[np.asarray(rows, dtype=int)] if np is not None else [values[row] for row in rows]
+            sanitized, _, link_errors = sanitizer.sanitize_column(subset)
+            if sanitized is not subset:
+                values = list(values)
+                for row, value in zip(rows, sanitized):
+                    values[row] = value
+            for position, error in link_errors.items():
+                errors[rows[position]] = error
+                mask[rows[position]] = False
+        if mask is None:
+            mask = [True] * len(values)
+        return values, mask, errors
+
+
+#: Shared sanitizer used by fields which are not given any sanitizer
+IDENTITY_SANITIZER = Sanitizer()
+
+
+def _valid_rows(mask: Sequence[bool]) -> List[int]:
+    if isinstance(mask, list):
+        return [row for row, ok in enumerate(mask) if ok]
+    return mask.nonzero()[0].tolist()
+
+
+def and_masks(left: Sequence[bool], right: Sequence[bool]) -> Sequence[bool]:
+    """
+    Combines two validity masks element-wise (NumPy arrays are combined vectorially).
+    """
+    if isinstance(left, list) and isinstance(right, list):
+        return [left_ok and right_ok for left_ok, right_ok in zip(left, right)]
+    return left & right
+
+
+def _fuse_chain(chain: Sequence[Sanitizer]) -> Callable[[Any], Any]:
+    """
+    Compiles a sequence of sanitizers into a single function with straight-line code.
+    Identity sanitizers are skipped, each run of adjacent checks with inline expressions
+    is merged into a single guard of literal comparisons (which only finds out the failing
+    check upon failure), other pure checks become a predicate call each, and bound methods
+    of all other sanitizers are looked up once in advance.
+    Predicates are called exactly once per value, just as in running the chain link by link.
+    """
+    namespace = {'ValidationError': ValidationError}
+    lines = ['def fused(value):']
+    run = []
+
+    def flush_run():
+        if len(run) > 1:
+            lines.append(f"    if not ({' and '.join(expr for expr, _ in run)}):")
+            for expr, error in run:
+                lines.append(f'        if not ({expr}):')
+                lines.append(f'            raise ValidationError({error})')
+        elif run:
+            ((expr, error),) = run
+            lines.append(f'    if not ({expr}):')
+            lines.append(f'        raise ValidationError({error})')
+        run.clear()
+
+    for index, sanitizer in enumerate(chain):
+        if sanitizer.is_identity:
+            continue
+        check = sanitizer.pure_check()
+        inline = None if check is None else sanitizer.inline_check(f'arg_{index}_')
+        if inline is not None:
+            expr, names = inline
+            namespace.update(names)
+            namespace[f'error_{index}'] = check[1]
+            run.append((expr, f'error_{index}'))
+            continue
+        flush_run()
+        if check is None:
+            namespace[f'sanitize_{index}'] = sanitizer.sanitize
+            lines.append(f'    value = sanitize_{index}(value)')
+        else:
+            namespace[f'check_{index}'], namespace[f'error_{index}'] = check
+            lines.append(f'    if not check_{index}(value):')
+            lines.append(f'        raise ValidationError(error_{index})')
+    flush_run()
+    lines.append('    return value')
+    exec('\n'.join(lines), namespace)
+    return namespace['fused']
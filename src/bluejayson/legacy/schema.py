@@ -2,10 +2,69 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from inspect import Parameter, Signature
-from typing import Dict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Type
 
+from bluejayson import profiling
 from bluejayson.legacy.exceptions import ValidationError
-from bluejayson.legacy.fields import BaseField
+from bluejayson.legacy.fields import BaseField, DefaultKind
+from bluejayson.legacy.sanitizers import SanitizerChain
+from bluejayson.legacy.validators import Validator
+
+
+class SchemaValidator:
+    """
+    Validation wrapper over a schema-level check which spans over multiple fields
+    (such as `start < end`). The wrapped function receives the schema instance
+    and returns True if and only if the instance passes the validation.
+
+    Attributes:
+        validate_func: Function accepting a schema instance and returning a boolean.
+        field_names: Names of all fields read by `validate_func`; the validator
+            is only re-run when one of these fields changes.
+        description: Error message of :exc:`ValidationError` upon failure.
+    """
+
+    def __init__(self, validate_func: Callable[[Any], bool], field_names: Iterable[str],
+                 description: Optional[str] = None):
+        self.validate_func = validate_func
+        self.field_names: FrozenSet[str] = frozenset(field_names)
+        self.description = (description or getattr(validate_func, '_description_', None)
+                            or f"validation failed on function {validate_func.__qualname__}")
+        self.validator_name = validate_func.__name__
+
+    def __set_name__(self, owner: type, name: str):
+        self.validator_name = name
+
+    def validate(self, instance):
+        """
+        Runs the check against the given schema instance
+        and raises :exc:`ValidationError` if it fails.
+        """
+        if not self.validate_func(instance):
+            raise ValidationError(self.description)
+
+    def __repr__(self):
+        return f"<{type(self).__qualname__} {self.validator_name} on {sorted(self.field_names)}>"
+
+
+def schema_validator(*field_names: str, description: Optional[str] = None):
+    """
+    Decorator turning a method of a schema class into a :py:class:`SchemaValidator`.
+
+    Args:
+        field_names: Names of all fields read by the decorated method
+        description: Error message upon validation failure
+
+    Returns:
+        Decorator producing an instance of :py:class:`SchemaValidator`.
+    """
+    if not field_names:
+        raise TypeError("schema validator must depend on at least one field")
+
+    def decorator(validate_func: Callable[[Any], bool]) -> SchemaValidator:
+        return SchemaValidator(validate_func, field_names, description)
+
+    return decorator
 
 
 class SchemaMeta(type):
@@ -15,31 +74,60 @@ class SchemaMeta(type):
     """
 
     def __new__(mcs, name, bases, dct):
-        all_fields = mcs._gather_all_fields(name, bases, dct)
+        all_fields, all_validators = mcs._gather_all_members(name, bases, dct)
         dct['bjs_all_fields'] = all_fields
+        dct['bjs_all_validators'] = all_validators
+        dct['bjs_field_dependents'] = mcs._index_dependents(name, all_fields, all_validators)
+        dct['bjs_required_fields'] = mcs._classify_defaults(all_fields)
         dct['__signature__'] = mcs._create_signature(all_fields)
         return super().__new__(mcs, name, bases, dct)
 
     @classmethod
-    def _gather_all_fields(mcs, name, bases, dct):
+    def _gather_all_members(mcs, name, bases, dct):
         all_fields = OrderedDict()
+        all_validators = OrderedDict()
 
         # Construct the class just for MRO (will be discarded)
         cls = super().__new__(mcs, name, bases, dct)
 
-        # Gather fields from parent classes in reversed MRO
+        # Gather fields and validators from parent classes in reversed MRO
         for parent_cls in cls.mro()[-1:0:-1]:
-            if not hasattr(parent_cls, 'bjs_all_fields'):
-                continue
-            for name, field in getattr(parent_cls, 'bjs_all_fields').items():
-                all_fields[name] = field
+            all_fields.update(getattr(parent_cls, 'bjs_all_fields', {}))
+            all_validators.update(getattr(parent_cls, 'bjs_all_validators', {}))
+
+        # Additionally gather fields and validators from class dict
+        for member_name, member in cls.__dict__.items():
+            if isinstance(member, BaseField):
+                all_fields[member_name] = member
+            elif isinstance(member, SchemaValidator):
+                all_validators[member_name] = member
+
+        return all_fields, all_validators
+
+    @classmethod
+    def _index_dependents(mcs, name, all_fields, all_validators):
+        dependents: Dict[str, Tuple[SchemaValidator, ...]] = {}
 
-        # Additionally gather fields from class dict
-        for name, field in cls.__dict__.items():
-            if isinstance(field, BaseField):
-                all_fields[name] = field
+        for validator in all_validators.values():
+            for field_name in sorted(validator.field_names):
+                if field_name not in all_fields:
+                    raise TypeError(f"schema validator {validator.validator_name} of {name} "
+                                    f"depends on unknown field {field_name}")
+                dependents[field_name] = dependents.get(field_name, ()) + (validator,)
+                all_fields[field_name].has_dependents = True
 
-        return all_fields
+        return dependents
+
+    @classmethod
+    def _classify_defaults(mcs, all_fields):
+        required_fields = []
+
+        for name, field in all_fields.items():
+            field.default_kind = DefaultKind.of(field.default)
+            if field.default_kind is DefaultKind.EMPTY:
+                required_fields.append(name)
+
+        return frozenset(required_fields)
 
     @classmethod
     def _create_signature(mcs, all_fields):
@@ -60,22 +148,108 @@ class BaseSchema(metaclass=SchemaMeta):
     Base Schema class for data definitions.
     """
     bjs_all_fields: Dict[str, BaseField]
+    bjs_all_validators: Dict[str, SchemaValidator]
+    bjs_field_dependents: Dict[str, Tuple[SchemaValidator, ...]]
+    bjs_required_fields: FrozenSet[str]
 
     def __init__(self, **params):
+        profiler = profiling.active
+        if profiler is not None and profiler.should_sample():
+            _profiled_init(self, params, profiler)
+            return
+        self.bjs_populate(self.bjs_sanitize_params(params))
+
+    @classmethod
+    def bjs_construct(cls, values: Dict[str, Any]):
+        """
+        Creates an instance out of field values which have already gone through
+        field sanitizers (hence they are not run again). Schema validators still run.
+        """
+        instance = cls.__new__(cls)
+        instance.bjs_populate(values)
+        return instance
+
+    def bjs_populate(self, values: Dict[str, Any]):
+        """
+        Stores already sanitized field values into a new instance,
+        then runs each schema validator exactly once.
+        Defaults of absent fields are left to be materialized on first read.
+        """
         cls = type(self)
+        _check_required(cls, values)
+        self.__dict__.update(values)
+        self.bjs_run_validators(cls.bjs_all_validators.values())
 
-        # TODO: Resolve parameters and field defaults
+    def bjs_update(self, **params):
+        """
+        Assigns multiple fields at once. Only schema validators depending on
+        at least one of the assigned fields are run (once each) and all fields
+        are reverted to their previous values if any of them fails.
+        """
+        cls = type(self)
+        values = self.bjs_sanitize_params(params)
+        self.bjs_commit(values, cls.bjs_affected_validators(values.keys()))
+
+    @classmethod
+    def bjs_sanitize_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs field sanitizers over the given mapping of field names to values.
+        """
+        all_fields = cls.bjs_all_fields
+        values = {}
         for name, value in params.items():
-            if name not in cls.bjs_all_fields.keys():
+            field = all_fields.get(name)
+            if field is None:
                 raise TypeError(f"unknown field {name}")
+            if field.sanitize_value is None:
+                values[name] = value
+                continue
             try:
-                setattr(self, name, value)
+                values[name] = field.sanitize_value(value)
             except ValidationError as e:
                 raise ValidationError(f"field {name}: {e.args[0]}") from e
+        return values
 
-        # TODO: Value validations (faking it right now)
-        for name in cls.bjs_all_fields.keys():
-            getattr(self, name)
+    @classmethod
+    def bjs_affected_validators(cls, field_names: Iterable[str]) -> Tuple[SchemaValidator, ...]:
+        """
+        Looks up schema validators depending on any of the given fields
+        through the index built at class creation (without duplicates).
+        """
+        affected = {}
+        for name in field_names:
+            affected.update(dict.fromkeys(cls.bjs_field_dependents.get(name, ())))
+        return tuple(affected)
+
+    def bjs_commit(self, values: Dict[str, Any], validators: Iterable[SchemaValidator]):
+        """
+        Stores already sanitized field values and then runs the given schema validators.
+        Previous field values are restored if any of the validators fails
+        (or raises any other exception).
+        """
+        storage = self.__dict__
+        previous = {name: storage[name] for name in values.keys() if name in storage}
+        storage.update(values)
+        try:
+            self.bjs_run_validators(validators)
+        except BaseException:
+            for name in values.keys():
+                if name in previous:
+                    storage[name] = previous[name]
+                else:
+                    del storage[name]
+            raise
+
+    def bjs_run_validators(self, validators: Iterable[SchemaValidator]):
+        """
+        Runs the given schema validators against this instance in order.
+        """
+        for validator in validators:
+            try:
+                validator.validate(self)
+            except ValidationError as e:
+                raise ValidationError(f"schema validator {validator.validator_name}: "
+                                      f"{e.args[0]}") from e
 
     def __repr__(self):
         cls = type(self)
@@ -98,3 +272,103 @@ class BaseSchema(metaclass=SchemaMeta):
             for name in field_names
         ]
         return f"<{clsname}{' ' if params else ''}{' '.join(params)}>"
+
+
+def _check_required(cls: Type[BaseSchema], values: Dict[str, Any]):
+    missing = cls.bjs_required_fields.difference(values.keys())
+    if missing:
+        raise TypeError(f"missing required fields {', '.join(sorted(missing))}")
+
+
+def _profiled_init(instance: BaseSchema, params: Dict[str, Any],
+                   profiler: profiling.SamplingProfiler):
+    """
+    Instrumented counterpart of :py:meth:`BaseSchema.__init__` which records
+    the time spent in each field sanitizer (link by link if the profiler asks
+    for it), in creating exceptions, and in each schema validator.
+    """
+    cls = type(instance)
+    sample = profiler.sample(cls.__qualname__)
+    try:
+        values = {}
+        for name, value in params.items():
+            field = cls.bjs_all_fields.get(name)
+            if field is None:
+                raise TypeError(f"unknown field {name}")
+            # Parsers take no part here since values are given as Python objects
+            if profiler.per_link:
+                values[name] = _profiled_sanitize_links(name, field, value, sample)
+            else:
+                values[name] = _profiled_sanitize(name, field, value, sample)
+        _check_required(cls, values)
+        instance.__dict__.update(values)
+        for validator in cls.bjs_all_validators.values():
+            frame = sample.frame(f"schema_validator:{profiling.frame_name(validator.validator_name)}")
+            try:
+                instance.bjs_run_validators((validator,))
+            finally:
+                frame.finish()
+    finally:
+        sample.finish()
+
+
+def _profiled_sanitize(name: str, field: BaseField, value, sample: profiling.Sample):
+    if field.sanitize_value is None:
+        return value
+    field_frame = f"field:{profiling.frame_name(name)}"
+    frame = sample.frame(field_frame)
+    cause = None
+    try:
+        value = field.sanitize_value(value)
+    except ValidationError as e:
+        cause = e
+    finally:
+        frame.finish()
+    if cause is not None:
+        failed = profiling.clock()
+        error = ValidationError(f"field {name}: {cause.args[0]}")
+        sample.record(f"{field_frame};exception", profiling.clock() - failed)
+        raise error from cause
+    return value
+
+
+def _profiled_sanitize_links(name: str, field: BaseField, value, sample: profiling.Sample):
+    """
+    Runs the links of the field sanitizer one at a time (rather than through
+    the fused function of the chain) so that each link can be timed on its own.
+    """
+    clock = profiling.clock
+    field_frame = f"field:{profiling.frame_name(name)}"
+    sanitizer = field.sanitizer
+    for link in sanitizer.chain if isinstance(sanitizer, SanitizerChain) else (sanitizer,):
+        if link.is_identity:
+            continue
+        # Pure checks are run here so that creating their exceptions can be measured too
+        check = link.pure_check()
+        frame = sample.frame(f"{field_frame};sanitizer:{_sanitizer_frame(link)}")
+        cause = None
+        try:
+            if check is None:
+                value = link.sanitize(value)
+                passed = True
+            else:
+                passed = check[0](value)
+        except ValidationError as e:
+            cause = e
+            passed = False
+        finally:
+            frame.finish()
+        if not passed:
+            failed = clock()
+            if cause is None:
+                cause = ValidationError(check[1])
+            error = ValidationError(f"field {name}: {cause.args[0]}")
+            sample.record(f"{field_frame};exception", clock() - failed)
+            raise error from cause
+    return value
+
+
+def _sanitizer_frame(sanitizer) -> str:
+    if isinstance(sanitizer, Validator):
+        return profiling.frame_name(f"Validator({sanitizer.description})")
+    return profiling.frame_name(type(sanitizer).__qualname__)
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 from bluejayson.legacy.exceptions import ValidationError
 from bluejayson.legacy.sanitizers import Sanitizer
+from bluejayson.validators import BaseValidator, Equal, Length, Range, _numpy_for
 
 
 class Validator(Sanitizer):
     """
     Validation wrapper over a function or a lambda which returns True if and only if
     the value of the input argument passes the validation.
+
+    Attributes:
+        validate_func: Function or lambda performing the validation
+            (which may also be a validator from :py:mod:`bluejayson.validators`).
+        description: Error message of :exc:`ValidationError` upon failure.
+        constraint: Validator from :py:mod:`bluejayson.validators` equivalent to
+            `validate_func` (if known) whose batch path is used for column-at-a-time checks.
     """
 
-    def __init__(self, validate_func: Callable[[Any], bool], description: Optional[str] = None):
+    def __init__(self, validate_func: Callable[[Any], bool], description: Optional[str] = None,
+                 constraint: Optional[BaseValidator] = None):
+        func_name = getattr(validate_func, '__qualname__', type(validate_func).__qualname__)
         self.validate_func = validate_func
         self.description = (description or getattr(validate_func, '_description_', None)
-                            or f"validation failed on function {validate_func.__qualname__}")
+                            or f"validation failed on function {func_name}")
+        if constraint is None and isinstance(validate_func, BaseValidator):
+            constraint = validate_func
+        self.constraint = constraint
 
     def sanitize(self, value):
         validation_result = self.validate_func(value)
@@ -23,6 +36,54 @@ class Validator(Sanitizer):
             raise ValidationError(self.description)
         return value
 
+    def pure_check(self) -> Optional[Tuple[Callable[[Any], bool], str]]:
+        if type(self).sanitize is not Validator.sanitize:
+            return None
+        return self.validate_func, self.description
+
+    def inline_check(self, prefix: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        constraint = self.constraint
+        if self.pure_check() is None or constraint is None or constraint is self.validate_func:
+            return None
+        if type(constraint) is Equal:
+            return f'value == {prefix}target', {f'{prefix}target': constraint.target}
+        if type(constraint) is Range:
+            return _inline_bounds('value', prefix, constraint.min, constraint.max,
+                                  constraint.min_inclusive, constraint.max_inclusive)
+        if type(constraint) is Length and constraint.equal is None:
+            return _inline_bounds('len(value)', prefix, constraint.min, constraint.max, True, True)
+        return None
+
+    def sanitize_column(self, values: Sequence) -> Tuple[Sequence, Sequence[bool], Dict[int, str]]:
+        if self.constraint is not None:
+            mask = self.constraint.validate_batch(values)
+        else:
+            mask = [bool(self.validate_func(value)) for value in values]
+        np = _numpy_for(mask)
+        if np is not None:
+            failing = np.flatnonzero(~mask).tolist()
+        else:
+            failing = [index for index, ok in enumerate(mask) if not ok]
+        return values, mask, dict.fromkeys(failing, self.description)
+
+
+def _inline_bounds(operand: str, prefix: str, lower, upper,
+                   lower_inclusive: bool, upper_inclusive: bool) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Writes the comparisons in the same form as the lambdas of the factory functions
+    (`value >= limit`, `value <= limit`, or `lower <= value <= upper`).
+    """
+    lower_op = '<=' if lower_inclusive else '<'
+    upper_op = '<=' if upper_inclusive else '<'
+    if lower is not None and upper is not None:
+        expr = f"{prefix}min {lower_op} {operand} {upper_op} {prefix}max"
+        return expr, {f'{prefix}min': lower, f'{prefix}max': upper}
+    if lower is not None:
+        return f"{operand} {'>=' if lower_inclusive else '>'} {prefix}min", {f'{prefix}min': lower}
+    if upper is not None:
+        return f"{operand} {upper_op} {prefix}max", {f'{prefix}max': upper}
+    return None
+
 
 ###############################
 # Validator factory functions #
@@ -38,7 +99,8 @@ def is_exactly(target):
     Returns:
         An instance of :py:class:`Validator`.
     """
-    return Validator(lambda value: value == target, f"should exactly match {target!r}")
+    return Validator(lambda value: value == target, f"should exactly match {target!r}",
+                     Equal(target))
 
 
 def upper_bound(limit, inclusive: bool = True) -> Validator:
@@ -53,9 +115,11 @@ def upper_bound(limit, inclusive: bool = True) -> Validator:
         An instance of :py:class:`Validator`.
     """
     if inclusive:
-        return Validator(lambda value: value <= limit, f"cannot be greater than {limit!r}")
+        return Validator(lambda value: value <= limit, f"cannot be greater than {limit!r}",
+                         _range_constraint(max=limit))
     else:
-        return Validator(lambda value: value < limit, f"cannot be {limit!r} or greater")
+        return Validator(lambda value: value < limit, f"cannot be {limit!r} or greater",
+                         _range_constraint(max=limit, max_inclusive=False))
 
 
 def lower_bound(limit, inclusive: bool = True) -> Validator:
@@ -70,9 +134,11 @@ def lower_bound(limit, inclusive: bool = True) -> Validator:
         An instance of :py:class:`Validator`.
     """
     if inclusive:
-        return Validator(lambda value: value >= limit, f"cannot be less than {limit!r}")
+        return Validator(lambda value: value >= limit, f"cannot be less than {limit!r}",
+                         _range_constraint(min=limit))
     else:
-        return Validator(lambda value: value > limit, f"cannot be {limit!r} or less")
+        return Validator(lambda value: value > limit, f"cannot be {limit!r} or less",
+                         _range_constraint(min=limit, min_inclusive=False))
 
 
 def between(lower_limit, upper_limit, inclusive: bool = True,
@@ -94,20 +160,27 @@ def between(lower_limit, upper_limit, inclusive: bool = True,
     """
     lower_inclusive = inclusive if lower_inclusive is None else lower_inclusive
     upper_inclusive = inclusive if upper_inclusive is None else upper_inclusive
+    constraint = _range_constraint(min=lower_limit, max=upper_limit,
+                                   min_inclusive=bool(lower_inclusive),
+                                   max_inclusive=bool(upper_inclusive))
     if lower_inclusive and upper_inclusive:
         return Validator(lambda value: lower_limit <= value <= upper_limit,
-                         f"must be between {lower_limit!r} and {upper_limit!r} (inclusive)")
+                         f"must be between {lower_limit!r} and {upper_limit!r} (inclusive)",
+                         constraint)
     elif lower_inclusive:
         return Validator(lambda value: lower_limit <= value < upper_limit,
                          f"must be between {lower_limit!r} (inclusive) and "
-                         f"{upper_limit!r} (exclusive)")
+                         f"{upper_limit!r} (exclusive)",
+                         constraint)
     elif upper_inclusive:
         return Validator(lambda value: lower_limit < value <= upper_limit,
                          f"must be between {lower_limit!r} (exclusive) and "
-                         f"{upper_limit!r} (inclusive)")
+                         f"{upper_limit!r} (inclusive)",
+                         constraint)
     else:
         return Validator(lambda value: lower_limit < value < upper_limit,
-                         f"must be between {lower_limit!r} and {upper_limit!r} (exclusive)")
+                         f"must be between {lower_limit!r} and {upper_limit!r} (exclusive)",
+                         constraint)
 
 
 def max_length(limit):
@@ -120,7 +193,8 @@ def max_length(limit):
     Returns:
         An instance of :py:class:`Validator`.
     """
-    return Validator(lambda value: len(value) <= limit, f"length cannot be greater than {limit!r}")
+    return Validator(lambda value: len(value) <= limit, f"length cannot be greater than {limit!r}",
+                     _length_constraint(max=limit))
 
 
 def min_length(limit):
@@ -133,7 +207,8 @@ def min_length(limit):
     Returns:
         An instance of :py:class:`Validator`.
     """
-    return Validator(lambda value: len(value) >= limit, f"length cannot be less than {limit!r}")
+    return Validator(lambda value: len(value) >= limit, f"length cannot be less than {limit!r}",
+                     _length_constraint(min=limit))
 
 
 def length_between(lower_limit, upper_limit):
@@ -148,4 +223,26 @@ def length_between(lower_limit, upper_limit):
         An instance of :py:class:`Validator`.
     """
     return Validator(lambda value: lower_limit <= len(value) <= upper_limit,
-                     f"length must be between {lower_limit!r} and {upper_limit!r} (inclusive)")
+                     f"length must be between {lower_limit!r} and {upper_limit!r} (inclusive)",
+                     _length_constraint(min=lower_limit, max=upper_limit))
+
+
+def _range_constraint(**arguments) -> Optional[Range]:
+    """
+    Builds the constraint equivalent to a legacy range validator. Limits which are
+    `None` make the legacy validator fail with :exc:`TypeError` whereas
+    :py:class:`Range` would treat them as unbounded, so no constraint is built then.
+    """
+    if any(arguments[name] is None for name in ('min', 'max') if name in arguments):
+        return None
+    return Range(**arguments)
+
+
+def _length_constraint(**arguments) -> Optional[Length]:
+    """
+    Builds the constraint equivalent to a legacy length validator
+    (unless the limits are not integers which :py:class:`Length` requires).
+    """
+    if not all(isinstance(limit, int) for limit in arguments.values()):
+        return None
+    return Length(**arguments)
@@ -7,12 +7,15 @@ https://marshmallow.readthedocs.io/en/stable/marshmallow.validate.html
 from __future__ import annotations
 
 import inspect
+import sys
 import warnings
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any, ClassVar, Literal
 
+from bluejayson import profiling
+
 
 class ValidationFailed(Exception):
     """
@@ -40,6 +43,12 @@ class ValidationFailed(Exception):
 class BaseValidator(metaclass=ABCMeta):
     """
     Base validator class for all kinds of validations.
+
+    Validators are immutable once constructed (built-in validators are frozen
+    dataclasses) and keep no state between calls, so a single validator
+    can be shared by any number of threads without locking.
+    Subclasses should uphold the same guarantee: any cache they need
+    must be either per-thread or safe to fill concurrently without locks.
     """
     #: Maintains a mapping from error codes (specific to each validator)
     #: to error messages as {}-formatted strings
@@ -66,8 +75,12 @@ class BaseValidator(metaclass=ABCMeta):
         """
         Checks whether an input value through a subroutine call to :meth:`validate_sub`.
         """
+        profiler = profiling.active
         try:
-            result = self.validate_sub(value)
+            if profiler is not None and profiler.should_sample():
+                result = self._profiled_validate_sub(value, profiler)
+            else:
+                result = self.validate_sub(value)
         except ValidationFailed:
             raise
         if result is not True:
@@ -75,6 +88,20 @@ class BaseValidator(metaclass=ABCMeta):
                                f"or raise ValidationFailure (but received {result!r})")
         return True
 
+    def _profiled_validate_sub(self, value, profiler: profiling.SamplingProfiler):
+        sample = profiler.sample(type(self).__qualname__)
+        started = profiling.clock()
+        try:
+            result = self.validate_sub(value)
+        except ValidationFailed as failure:
+            sample.record(f"failed:{failure.error_code}", profiling.clock() - started)
+            raise
+        else:
+            sample.record('passed', profiling.clock() - started)
+        finally:
+            sample.finish()
+        return result
+
     def __call__(self, value) -> bool:
         """
         Alias method for :meth:`validate` method but converts :exc:`ValidationFailure`
@@ -85,8 +112,45 @@ class BaseValidator(metaclass=ABCMeta):
         except ValidationFailed:
             return False
 
+    def validate_batch(self, values: Sequence) -> Sequence[bool]:
+        """
+        Checks a whole column of values at once and returns the sequence of booleans
+        indicating which of them are valid (as if :meth:`__call__` were applied to each).
+        Subclasses may override this method with a faster path which, for instance,
+        returns a boolean NumPy array when given a NumPy array.
+        """
+        return [self(value) for value in values]
+
+    def classify_batch(self, values: Sequence) -> list[str | None]:
+        """
+        Checks a whole column of values at once and returns the list of error codes
+        (with `None` for each valid value) as if :meth:`validate` were applied to each.
+        Subclasses should override this method with a path which determines
+        error codes without raising :exc:`ValidationFailed` for every rejected value.
+        """
+        codes = []
+        for value in values:
+            try:
+                self.validate(value)
+            except ValidationFailed as failure:
+                codes.append(failure.error_code)
+            else:
+                codes.append(None)
+        return codes
+
+
+def _numpy_for(values):
+    """
+    Returns the NumPy module if the given values are a NumPy array (or None otherwise).
+    NumPy is never imported here; an array can only exist if NumPy has been imported.
+    """
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(values, np.ndarray):
+        return np
+    return None
 
-@dataclass
+
+@dataclass(frozen=True)
 class Predicate(BaseValidator):
     """
     Wraps over a custom predicate (boolean) function.
@@ -131,7 +195,7 @@ class Predicate(BaseValidator):
         return True
 
 
-@dataclass
+@dataclass(frozen=True)
 class Equal(BaseValidator):
     """
     Checks whether a given value matches (i.e. is equal to) the given `target`.
@@ -148,8 +212,18 @@ class Equal(BaseValidator):
             raise ValidationFailed(value, self, 'not_matched')
         return True
 
+    def validate_batch(self, values: Sequence) -> Sequence[bool]:
+        np = _numpy_for(values)
+        if np is not None and np.isscalar(self.target):
+            return values == self.target
+        target = self.target
+        return [not (value != target) for value in values]
+
+    def classify_batch(self, values: Sequence) -> list[str | None]:
+        return [None if ok else 'not_matched' for ok in self.validate_batch(values)]
 
-@dataclass
+
+@dataclass(frozen=True)
 class Range(BaseValidator):
     """
     Checks whether a given value falls within a defined bounded range.
@@ -192,6 +266,39 @@ class Range(BaseValidator):
             raise ValidationFailed(value, self, 'out_of_range')
         return True
 
+    def validate_batch(self, values: Sequence) -> Sequence[bool]:
+        np = _numpy_for(values)
+        if np is not None and values.dtype.kind in 'biuf':
+            mask = np.ones(values.shape, dtype=bool)
+            mask &= self._compare_lower(values)
+            mask &= self._compare_upper(values)
+            return mask
+        return [self._accepts(value) for value in values]
+
+    def classify_batch(self, values: Sequence) -> list[str | None]:
+        np = _numpy_for(values)
+        if np is not None and values.dtype.kind in 'biuf':
+            mask = self.validate_batch(values).tolist()
+            return [None if ok else 'out_of_range' for ok in mask]
+        return [self._classify(value) for value in values]
+
+    def _accepts(self, value) -> bool:
+        try:
+            return self._compare_lower(value) and self._compare_upper(value)
+        except TypeError:
+            if self.absorb_cmp_error:
+                return False
+            raise
+
+    def _classify(self, value) -> str | None:
+        try:
+            result = self._compare_lower(value) and self._compare_upper(value)
+        except TypeError:
+            if self.absorb_cmp_error:
+                return 'incomparable'
+            raise
+        return None if result else 'out_of_range'
+
     def _compare_lower(self, value) -> bool:
         return self.min is None or (value >= self.min if self.min_inclusive else value > self.min)
 
@@ -210,7 +317,7 @@ class Range(BaseValidator):
         return statement
 
 
-@dataclass
+@dataclass(frozen=True)
 class Length(BaseValidator):
     """
     Checks whether a given value has the length adhering to the specified bounded range.
@@ -255,6 +362,43 @@ class Length(BaseValidator):
             raise ValidationFailed(value, self, 'length_out_of_range')
         return True
 
+    def validate_batch(self, values: Sequence) -> Sequence[bool]:
+        np = _numpy_for(values)
+        if np is not None and values.dtype.kind in 'SU':
+            lengths = np.char.str_len(values)
+            mask = np.ones(values.shape, dtype=bool)
+            mask &= self._compare_lower(lengths)
+            mask &= self._compare_upper(lengths)
+            return mask
+        return [self._accepts(value) for value in values]
+
+    def classify_batch(self, values: Sequence) -> list[str | None]:
+        np = _numpy_for(values)
+        if np is not None and values.dtype.kind in 'SU':
+            mask = self.validate_batch(values).tolist()
+            return [None if ok else 'length_out_of_range' for ok in mask]
+        return [self._classify(value) for value in values]
+
+    def _accepts(self, value) -> bool:
+        try:
+            length = len(value)
+        except TypeError:
+            if self.absorb_len_error:
+                return False
+            raise
+        return self._compare_lower(length) and self._compare_upper(length)
+
+    def _classify(self, value) -> str | None:
+        try:
+            length = len(value)
+        except TypeError:
+            if self.absorb_len_error:
+                return 'uncomputable_length'
+            raise
+        if not (self._compare_lower(length) and self._compare_upper(length)):
+            return 'length_out_of_range'
+        return None
+
     def _compare_lower(self, length: int) -> bool:
         return self.min is None or self.min <= length
 
@@ -0,0 +1,192 @@
+"""
+Compact error reporting for validating large batches of values.
+
+Instead of keeping one :exc:`ValidationFailed` per rejected value,
+failures are grouped by their (validator, error code) pair and only
+row indices are kept for each group (plus a few sample values
+so that messages can be rendered on demand).
+Failures of legacy validators (:exc:`ValidationError` raised by
+field sanitizers or schema validators) are grouped by their
+source and error message instead.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from bluejayson.validators import BaseValidator, ValidationFailed, _numpy_for
+
+
+class ErrorGroup:
+    """
+    All failures sharing the same validator and error code.
+    """
+    __slots__ = ('validator', 'error_code', 'rows', 'samples')
+
+    #: Validator which rejected the values (for legacy failures, the legacy validator
+    #: or field name reporting them, if known)
+    validator: BaseValidator | Any
+
+    #: Error code reported by the validator (for legacy failures, the error message)
+    error_code: str
+
+    #: Indices of all rejected rows (in the order they were added)
+    rows: array
+
+    #: Rejected values of the first few rows (aligned with `rows`)
+    samples: list[Any]
+
+    def __init__(self, validator: BaseValidator | Any, error_code: str):
+        self.validator = validator
+        self.error_code = error_code
+        self.rows = array('q')
+        self.samples = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return (f"<{type(self).__qualname__} {type(self.validator).__qualname__}"
+                f"[{self.error_code}] x{len(self.rows)}>")
+
+    @property
+    def is_legacy(self) -> bool:
+        """
+        Whether the failures are legacy ones (whose error code is the message itself).
+        """
+        return not isinstance(self.validator, BaseValidator)
+
+    def messages(self, limit: int = None) -> list[tuple[int, str]]:
+        """
+        Renders error messages of the first `limit` failures
+        (at most the number of kept sample values) as (row index, message) pairs.
+        """
+        count = len(self.samples) if limit is None else min(limit, len(self.samples))
+        if self.is_legacy:
+            return [(self.rows[i], self.error_code) for i in range(count)]
+        return [
+            (self.rows[i], str(ValidationFailed(self.samples[i], self.validator, self.error_code)))
+            for i in range(count)
+        ]
+
+
+class ErrorCollector:
+    """
+    Collects validation failures of a batch of values
+    with interned (validator, error code) pairs.
+
+    Unlike validators, a collector is mutable: use one collector per thread
+    (for instance, one per batch) and combine them afterwards with :meth:`merge`.
+    """
+
+    #: Number of rejected values kept per group for rendering messages
+    keep_values: int
+
+    def __init__(self, keep_values: int = 10):
+        self.keep_values = keep_values
+        self._groups: dict[tuple[int, str], ErrorGroup] = {}
+
+    def __len__(self):
+        return sum(len(group) for group in self._groups.values())
+
+    def __bool__(self):
+        return bool(self._groups)
+
+    def __iter__(self) -> Iterator[ErrorGroup]:
+        return iter(self._groups.values())
+
+    def add(self, index: int, validator: BaseValidator, error_code: str, value: Any = None):
+        """
+        Records that the value at the given row index was rejected by the validator.
+        """
+        group = self._group(validator, error_code)
+        group.rows.append(index)
+        if len(group.samples) < self.keep_values:
+            group.samples.append(value)
+
+    def _group(self, validator: BaseValidator | Any, error_code: str) -> ErrorGroup:
+        key = (id(validator), error_code)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = ErrorGroup(validator, error_code)
+        return group
+
+    def merge(self, other: ErrorCollector):
+        """
+        Adds all failures recorded by another collector (such as one from another thread).
+        """
+        for other_group in other:
+            group = self._group(other_group.validator, other_group.error_code)
+            if len(group.samples) == len(group.rows):
+                group.samples.extend(other_group.samples[:self.keep_values - len(group.samples)])
+            group.rows.extend(other_group.rows)
+
+    def add_failure(self, index: int, failure: ValidationFailed):
+        """
+        Records the given failure of the value at the given row index.
+        """
+        self.add(index, failure.validator, failure.error_code, failure.value)
+
+    def add_error(self, index: int, error: Exception, source: Any = None, value: Any = None):
+        """
+        Records a legacy :exc:`ValidationError` of the row at the given index
+        (such as one raised while constructing a schema instance).
+        Failures are grouped by their source (such as the legacy validator
+        which raised the error, if known) and their error message.
+        """
+        self.add(index, source, str(error.args[0]) if error.args else str(error), value)
+
+    def add_columns(self, result, start: int = 0):
+        """
+        Records all failures reported by :py:func:`bluejayson.legacy.columnar.validate_columns`,
+        grouped by field name (or the key of schema validator failures) and error message;
+        row indices are counted from `start`.
+        """
+        for name, errors in result.errors.items():
+            column = result.columns.get(name)
+            for index, message in errors.items():
+                self.add(start + index, name, message, None if column is None else column[index])
+
+    def validate(self, validator: BaseValidator, values: Sequence, start: int = 0) -> Sequence[bool]:
+        """
+        Validates a batch of values through :meth:`BaseValidator.validate_batch`
+        and records each rejected value with its error code determined
+        by :meth:`BaseValidator.classify_batch`; row indices are counted from `start`.
+        Returns the validity mask computed by the validator.
+        """
+        mask = validator.validate_batch(values)
+        np = _numpy_for(mask)
+        if np is not None:
+            offsets = np.flatnonzero(~mask)
+            rejected = values[offsets] if _numpy_for(values) is not None else [values[i] for i in offsets]
+            offsets = offsets.tolist()
+        else:
+            offsets = [offset for offset, ok in enumerate(mask) if not ok]
+            rejected = [values[offset] for offset in offsets]
+        groups = {}
+        keep_values = self.keep_values
+        for offset, error_code, value in zip(offsets, validator.classify_batch(rejected), rejected):
+            if error_code is None:
+                continue
+            group = groups.get(error_code)
+            if group is None:
+                group = groups[error_code] = self._group(validator, error_code)
+            group.rows.append(start + offset)
+            if len(group.samples) < keep_values:
+                group.samples.append(value)
+        return mask
+
+    def summary(self) -> list[tuple[BaseValidator, str, int]]:
+        """
+        Returns (validator, error code, count) triples ordered by decreasing count.
+        """
+        groups = sorted(self._groups.values(), key=len, reverse=True)
+        return [(group.validator, group.error_code, len(group)) for group in groups]
+
+    def messages(self, limit: int = None) -> list[tuple[int, str]]:
+        """
+        Renders error messages of the first `limit` failures of each group
+        as (row index, message) pairs.
+        """
+        return [message for group in self._groups.values() for message in group.messages(limit)]
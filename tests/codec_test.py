@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from bluejayson.legacy import fields
+from bluejayson.legacy import validators as legacy_validators
+from bluejayson.legacy.codec import SchemaCodec
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+
+
+class Event(BaseSchema):
+    name: str = fields.StrField(sanitizer=legacy_validators.length_between(1, 16))
+    count: int = fields.IntField(default=0)
+    active: bool = fields.BoolField(default=True)
+    offset: int = fields.IntField(default=None)
+    flagged: bool = fields.BoolField(default=None)
+    note: str = fields.StrField(default=None)
+    tags: list = fields.ListField(str, default=list)
+    extra: dict = fields.DictField(int, default=dict)
+
+    @schema_validator('count', 'offset')
+    def offset_within_count(self):
+        return self.offset is None or self.offset <= self.count
+
+
+class Other(BaseSchema):
+    name: str = fields.StrField()
+
+
+def make_events(n):
+    return [
+        Event(name=f"ev{i}", count=i * 1000, active=i % 2 == 0, offset=-i if i % 3 else None,
+              note="héllo" if i % 2 else None, tags=[str(i)] * (i % 3), extra={'k': i})
+        for i in range(n)
+    ]
+
+
+def snapshot(event):
+    return {name: getattr(event, name) for name in Event.bjs_all_fields}
+
+
+def test_roundtrip():
+    codec = SchemaCodec(Event)
+    for event in make_events(7):
+        data = codec.encode(event)
+        assert snapshot(codec.decode(data)) == snapshot(event)
+
+
+def test_compact():
+    codec = SchemaCodec(Event)
+    event = Event(name="x", count=5, flagged=False)
+    data = codec.encode(event)
+    assert b'count' not in data
+    assert len(data) < len(pickle.dumps(event.__dict__))
+    assert snapshot(codec.decode(data)) == snapshot(event)
+
+
+def test_batch_lazy():
+    codec = SchemaCodec(Event)
+    events = make_events(50)
+    buffer = codec.encode_batch(events)
+    assert isinstance(buffer, bytes)
+    batch = codec.decode_batch(memoryview(buffer))
+    assert len(batch) == 50
+    assert snapshot(batch[17]) == snapshot(events[17])
+    assert snapshot(batch[-1]) == snapshot(events[-1])
+    assert [snapshot(e) for e in batch[2:5]] == [snapshot(e) for e in events[2:5]]
+    assert [snapshot(e) for e in batch] == [snapshot(e) for e in events]
+    assert isinstance(batch.record_bytes(3), memoryview)
+    with pytest.raises(IndexError):
+        batch[50]
+
+
+def test_batch_decode_only_requested_record():
+    codec = SchemaCodec(Event)
+    buffer = bytearray(codec.encode_batch(make_events(3)))
+    last = len(codec.encode(make_events(3)[2]))
+    buffer[-last:] = bytes(last)  # corrupt the last record
+    batch = codec.decode_batch(buffer)
+    assert batch[0].name == "ev0"
+    with pytest.raises(ValueError):
+        batch[2]
+
+
+def test_empty_batch():
+    codec = SchemaCodec(Event)
+    assert len(codec.decode_batch(codec.encode_batch([]))) == 0
+
+
+def test_schema_validators_run_on_decode():
+    codec = SchemaCodec(Event)
+    event = Event(name="x", count=1)
+    event.__dict__['offset'] = 5
+    with pytest.raises(ValidationError):
+        codec.decode(codec.encode(event))
+
+
+def test_invalid_values():
+    codec = SchemaCodec(Event)
+    event = Event(name="x")
+    event.__dict__['count'] = "many"
+    with pytest.raises(TypeError):
+        codec.encode(event)
+    event.__dict__['count'] = 2 ** 64
+    with pytest.raises(OverflowError):
+        codec.encode(event)
+    event.__dict__['count'] = True
+    with pytest.raises(TypeError):
+        codec.encode(event)
+    event.__dict__['count'] = 1
+    event.__dict__['active'] = 1
+    with pytest.raises(TypeError):
+        codec.encode(event)
+
+
+@pytest.mark.parametrize('name, value', [
+    ('name', 5),
+    ('note', b'bytes'),
+    ('extra', {1: 2}),
+    ('extra', {'k': (1, 2)}),
+    ('tags', (1, 2)),
+    ('tags', [{1, 2}]),
+    ('tags', [object()]),
+])
+def test_values_not_round_tripping(name, value):
+    codec = SchemaCodec(Event)
+    event = Event(name="x")
+    event.__dict__[name] = value
+    with pytest.raises(TypeError, match=f"field {name}"):
+        codec.encode(event)
+
+
+def test_tuple_default():
+    class Pair(BaseSchema):
+        pair: tuple = fields.ListField(int, default=(1, 2))
+
+    codec = SchemaCodec(Pair)
+    assert codec.decode(codec.encode(Pair())).pair == (1, 2)
+    assert codec.decode(codec.encode(Pair(pair=(3, "x")))).pair == (3, "x")
+    for value in ([1, 2], ((1, 2),), ({1: 2},)):
+        with pytest.raises(TypeError, match="field pair"):
+            codec.encode(Pair(pair=value))
+
+
+@pytest.mark.parametrize('default', [b'bytes', frozenset({1}), 1j, (1, b'x'), range(3)])
+def test_unencodable_default_rejected(default):
+    class Odd(BaseSchema):
+        value = fields.BaseField(default=default)
+
+    with pytest.raises(TypeError, match="Odd cannot be encoded: default of field value"):
+        SchemaCodec(Odd)
+
+
+def test_invalid_batches():
+    codec = SchemaCodec(Event)
+    with pytest.raises(ValueError):
+        codec.decode_batch(b'')
+    with pytest.raises(ValueError):
+        codec.decode_batch(b'XXXX' + bytes(20))
+    other = SchemaCodec(Other).encode_batch([Other(name="a")])
+    with pytest.raises(ValueError):
+        codec.decode_batch(other)
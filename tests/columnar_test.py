@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import fields
+from bluejayson.legacy import validators as legacy_validators
+from bluejayson.legacy.columnar import SCHEMA_ERRORS, validate_columns
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.sanitizers import Sanitizer
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+from bluejayson.validators import Equal, Length, Range
+
+
+class Reading(BaseSchema):
+    sensor: str = fields.StrField(sanitizer=legacy_validators.length_between(1, 8))
+    value: int = fields.IntField(sanitizer=legacy_validators.between(0, 100))
+    unit: str = fields.StrField(default="C", sanitizer=legacy_validators.is_exactly("C"))
+
+
+def test_validate_batch_lists():
+    mask = Range(min=0, max=10).validate_batch([-1, 0, 10, 11, "x"])
+    assert mask == [False, True, True, False, False]
+    assert Length(max=2).validate_batch(["", "ab", "abc", 5]) == [True, True, False, False]
+    assert Equal("a").validate_batch(["a", "b"]) == [True, False]
+
+
+def test_validate_batch_numpy():
+    np = pytest.importorskip('numpy')
+    mask = Range(min=0, max=10).validate_batch(np.array([-1, 0, 10, 11]))
+    assert mask.tolist() == [False, True, True, False]
+    assert Range().validate_batch(np.array([1, 2])).tolist() == [True, True]
+    assert Length(min=2).validate_batch(np.array(["a", "ab"])).tolist() == [False, True]
+    assert Equal(3).validate_batch(np.array([3, 4])).tolist() == [True, False]
+
+
+def test_validate_columns():
+    result = validate_columns(Reading, {
+        'sensor': ["a", "", "c", "d"],
+        'value': [1, 2, 300, 4],
+    })
+    assert result.valid == [True, False, False, True]
+    assert result.invalid_rows() == [1, 2]
+    assert result.errors['sensor'][1] is not None
+    assert result.errors['value'][2] is not None
+    assert list(result.row_errors(2)) == ['value']
+    instances = list(result.instances())
+    assert [(r.sensor, r.value, r.unit) for r in instances] == [("a", 1, "C"), ("d", 4, "C")]
+
+
+def test_validate_columns_numpy():
+    np = pytest.importorskip('numpy')
+    result = validate_columns(Reading, {
+        'sensor': np.array(["a", "bb"]),
+        'value': np.array([50, -1]),
+    })
+    assert isinstance(result.valid, np.ndarray)
+    assert result.valid.tolist() == [True, False]
+    assert result.invalid_rows() == [1]
+    assert list(result.row_errors(1)) == ['value']
+    instance = result.instance(0)
+    assert type(instance.value) is int and instance.value == 50
+
+
+def test_validate_columns_bad_input():
+    with pytest.raises(TypeError):
+        validate_columns(Reading, {'value': [1]})
+    with pytest.raises(TypeError):
+        validate_columns(Reading, {'sensor': ["a"], 'value': [1], 'extra': [1]})
+    with pytest.raises(ValueError):
+        validate_columns(Reading, {'sensor': ["a"], 'value': [1, 2]})
+
+
+def test_validate_columns_schema_validators():
+    class Period(BaseSchema):
+        start: int = fields.IntField()
+        end: int = fields.IntField()
+
+        @schema_validator('start', 'end')
+        def check_order(self):
+            return self.start < self.end
+
+    result = validate_columns(Period, {'start': [1, 5, 2], 'end': [2, 3, 4]})
+    assert result.valid == [True, False, True]
+    assert result.invalid_rows() == [1]
+    assert list(result.row_errors(1)) == [SCHEMA_ERRORS]
+    assert "check_order" in result.errors[SCHEMA_ERRORS][1]
+    assert [r.end for r in result.instances()] == [2, 4]
+    with pytest.raises(ValidationError):
+        result.instance(1)
+
+
+def test_validate_columns_schema_validators_numpy():
+    np = pytest.importorskip('numpy')
+
+    class Period(BaseSchema):
+        start: int = fields.IntField(sanitizer=legacy_validators.lower_bound(0))
+        end: int = fields.IntField()
+
+        @schema_validator('start', 'end')
+        def check_order(self):
+            return self.start < self.end
+
+    result = validate_columns(Period, {'start': np.array([1, -1, 5]), 'end': np.array([2, 0, 3])})
+    assert result.valid.tolist() == [True, False, False]
+    assert list(result.row_errors(1)) == ['start']
+    assert list(result.row_errors(2)) == [SCHEMA_ERRORS]
+
+
+def test_factory_constraints_with_loose_arguments():
+    validator = legacy_validators.between(1, 10, inclusive=1)
+    assert validator.constraint == Range(min=1, max=10)
+    assert validator(10) == 10
+    validator = legacy_validators.between(1, 10, lower_inclusive=0)
+    assert validator.constraint == Range(min=1, max=10, min_inclusive=False)
+    with pytest.raises(ValidationError):
+        validator(1)
+    for validator, valid, invalid in [
+        (legacy_validators.max_length(3.5), "abc", "abcd"),
+        (legacy_validators.min_length(2.0), "ab", "a"),
+        (legacy_validators.length_between(1.0, 5), "a", ""),
+    ]:
+        assert validator.constraint is None
+        assert validator(valid) == valid
+        with pytest.raises(ValidationError):
+            validator(invalid)
+        _, mask, errors = validator.sanitize_column([valid, invalid])
+        assert mask == [True, False] and list(errors) == [1]
+
+
+def test_validate_columns_chain_skips_rejected_rows():
+    class Strip(Sanitizer):
+        def sanitize(self, value):
+            return value.strip()
+
+    is_str = legacy_validators.Validator(lambda value: isinstance(value, str), "must be str")
+
+    class Named(BaseSchema):
+        name: str = fields.StrField(sanitizer=is_str @ Strip() @ legacy_validators.min_length(1))
+
+    with pytest.raises(ValidationError, match="must be str"):
+        Named(name=1)
+    result = validate_columns(Named, {'name': [" a ", 1, "  ", "b"]})
+    assert result.valid == [True, False, False, True]
+    assert result.row_errors(1) == {'name': "must be str"}
+    assert result.row_errors(2) == {'name': "length cannot be less than 1"}
+    assert [r.name for r in result.instances()] == ["a", "b"]
+
+
+def test_validate_columns_chain_skips_rejected_rows_numpy():
+    np = pytest.importorskip('numpy')
+
+    class Bounded(BaseSchema):
+        value: int = fields.IntField(sanitizer=legacy_validators.lower_bound(0)
+                                     @ legacy_validators.upper_bound(10))
+
+    result = validate_columns(Bounded, {'value': np.array([-1, 5, 20])})
+    assert result.valid.tolist() == [False, True, False]
+    assert result.row_errors(0) == {'value': "cannot be less than 0"}
+    assert result.row_errors(2) == {'value': "cannot be greater than 10"}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import fields, validators
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.sanitizers import IDENTITY_SANITIZER, Sanitizer
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+
+
+class Plain(BaseSchema):
+    name: str = fields.StrField()
+    age: int = fields.IntField(sanitizer=validators.lower_bound(0))
+    nickname: str = fields.StrField(sanitizer=Sanitizer() @ Sanitizer())
+
+    @schema_validator('age')
+    def check_age(self):
+        return self.age < 200
+
+
+def test_default_stages_are_shared():
+    first, second = fields.StrField(), fields.IntField()
+    assert first.parser is second.parser
+    assert first.sanitizer is second.sanitizer is IDENTITY_SANITIZER
+    assert first.formatter is second.formatter
+
+
+def test_passthrough_detection():
+    name, age, nickname = (Plain.bjs_all_fields[key] for key in ['name', 'age', 'nickname'])
+    assert name.sanitize_value is None and not name.has_dependents
+    assert age.sanitize_value is not None and age.has_dependents
+    assert nickname.sanitize_value is None
+
+
+def test_passthrough_assignment():
+    person = Plain(name="John", age=20, nickname="J")
+    person.name = "Jack"
+    assert person.name == "Jack"
+    with pytest.raises(ValidationError):
+        person.age = -1
+    with pytest.raises(ValidationError):
+        person.age = 200
+    assert person.age == 20
+
+
+def test_sanitizer_reassignment():
+    field = fields.IntField()
+    field.sanitizer = validators.upper_bound(10)
+    assert field.sanitize_value is not None
+    field.sanitizer = Sanitizer()
+    assert field.sanitize_value is None
+
+
+class Defaulted(BaseSchema):
+    name: str = fields.StrField()
+    label: str = fields.StrField(default="unnamed")
+    tags: tuple = fields.BaseField(default=("a", ("b", 1)))
+    counts: dict = fields.BaseField(default={'a': 1})
+    inventory: list = fields.ListField(int, default=list)
+
+
+def test_default_classification():
+    kinds = {name: field.default_kind for name, field in Defaulted.bjs_all_fields.items()}
+    assert kinds == {
+        'name': fields.DefaultKind.EMPTY,
+        'label': fields.DefaultKind.SHARED,
+        'tags': fields.DefaultKind.SHARED,
+        'counts': fields.DefaultKind.CONSTANT,
+        'inventory': fields.DefaultKind.FACTORY,
+    }
+    assert Defaulted.bjs_required_fields == {'name'}
+
+
+def test_lazy_defaults():
+    first, second = Defaulted(name="first"), Defaulted(name="second")
+    assert first.__dict__ == {'name': "first"}
+    assert first.label == "unnamed" and first.tags == ("a", ("b", 1))
+    assert first.__dict__ == {'name': "first"}
+    assert first.inventory == [] and first.inventory is first.inventory
+    assert first.inventory is not second.inventory
+    assert set(first.__dict__) == {'name', 'inventory'}
+
+
+def test_missing_required_field():
+    with pytest.raises(TypeError):
+        Defaulted(label="nameless")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import bluejayson
+
+#: Upper limit of the cumulative time to import the package (in microseconds)
+IMPORT_BUDGET_US = 10_000
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True,
+                          text=True, check=True)
+
+
+def test_import_is_lazy():
+    result = run_python('-c', (
+        "import sys, bluejayson; "
+        "print(sorted(name for name in sys.modules if name.startswith('bluejayson')))"
+    ))
+    assert result.stdout.strip() == "['bluejayson']"
+
+
+def test_import_time_budget():
+    result = run_python('-X', 'importtime', '-c', "import bluejayson")
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if name.strip() == 'bluejayson':
+            assert int(cumulative) < IMPORT_BUDGET_US
+            break
+    else:
+        raise AssertionError("import time of bluejayson is not reported")
+
+
+def test_lazy_metadata():
+    metadata_file = os.path.join(os.path.dirname(bluejayson.__file__), 'meta.json')
+    with open(metadata_file) as fobj:
+        metadata = json.load(fobj)
+    assert bluejayson.__version__ == metadata['version']
+    assert bluejayson.__author__ == metadata['author']
+    assert bluejayson.__maintainers__ == metadata['maintainers']
+    assert '__version__' in dir(bluejayson) and 'validators' in dir(bluejayson)
+
+
+def test_lazy_submodules():
+    from bluejayson import validators
+    assert bluejayson.validators is validators
+    assert bluejayson.legacy.__name__ == 'bluejayson.legacy'
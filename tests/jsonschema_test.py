@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from bluejayson.legacy import fields, jsonschema, validators
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.schema import BaseSchema
+from bluejayson.validators import Range
+
+
+class Person(BaseSchema):
+    name: str = fields.StrField(sanitizer=validators.length_between(1, 255))
+    age: int = fields.IntField(sanitizer=validators.lower_bound(0) @ validators.upper_bound(150))
+    score: int = fields.IntField(
+        default=0,
+        sanitizer=validators.Validator(Range(max=10, max_inclusive=False)),
+    )
+    married: bool = fields.BoolField(default=True)
+    tags: list = fields.ListField(str, default=list, sanitizer=validators.max_length(3))
+    kind: str = fields.StrField(default="human", sanitizer=validators.is_exactly("human"))
+
+
+PERSON_DOCUMENT = {
+    '$schema': jsonschema.DIALECT,
+    'title': 'Person',
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string', 'minLength': 1, 'maxLength': 255},
+        'age': {'type': 'integer', 'minimum': 0, 'allOf': [{'maximum': 150}]},
+        'score': {'type': 'integer', 'exclusiveMaximum': 10, 'default': 0},
+        'married': {'type': 'boolean', 'default': True},
+        'tags': {'type': 'array', 'items': {'type': 'string'}, 'maxItems': 3, 'default': []},
+        'kind': {'type': 'string', 'const': 'human', 'default': 'human'},
+    },
+    'required': ['name', 'age'],
+    'additionalProperties': False,
+}
+
+
+def test_export_json_schema():
+    document = jsonschema.export_json_schema(Person)
+    assert document['properties']['age'] == {'type': 'integer', 'minimum': 0, 'maximum': 150}
+    document['properties']['age'] = PERSON_DOCUMENT['properties']['age']
+    assert document == PERSON_DOCUMENT
+
+
+def test_load_json_schema():
+    document = dict(PERSON_DOCUMENT)
+    document['properties'] = dict(
+        document['properties'],
+        age={'type': 'integer', 'minimum': 0, 'maximum': 150},
+    )
+    schema = jsonschema.load_json_schema(document)
+    assert schema.__name__ == 'Person'
+    assert list(schema.bjs_all_fields) == list(Person.bjs_all_fields)
+    assert schema.bjs_required_fields == {'name', 'age'}
+    person = schema(name="John", age=30)
+    assert (person.score, person.married, person.tags, person.kind) == (0, True, [], "human")
+    for invalid in [dict(age=-1), dict(age=151), dict(name=""), dict(score=10), dict(tags=[1, 2, 3, 4]),
+                    dict(age="30"), dict(age=True), dict(married=None), dict(tags=[1])]:
+        with pytest.raises(ValidationError):
+            schema(**dict(dict(name="John", age=30), **invalid))
+    assert jsonschema.export_json_schema(schema) == document
+
+
+def test_load_json_schema_cache(tmp_path, monkeypatch):
+    first = jsonschema.load_json_schema(PERSON_DOCUMENT, cache_dir=str(tmp_path))
+    cached_files = [name for name in os.listdir(tmp_path) if name.endswith('.py')]
+    assert cached_files == [f'bjs_schema_{jsonschema.json_schema_digest(PERSON_DOCUMENT)[:32]}.py']
+
+    def fail_compile(document):
+        raise AssertionError("unchanged schema should not be recompiled")
+
+    monkeypatch.setattr(jsonschema, 'compile_json_schema', fail_compile)
+    reordered = dict(reversed(list(PERSON_DOCUMENT.items())))
+    second = jsonschema.load_json_schema(reordered, cache_dir=str(tmp_path))
+    assert list(second.bjs_all_fields) == list(first.bjs_all_fields)
+
+
+def test_compile_json_schema_unsupported():
+    with pytest.raises(ValueError):
+        jsonschema.compile_json_schema({'type': 'array'})
+    with pytest.raises(ValueError):
+        jsonschema.compile_json_schema({'properties': {'name': {'type': 'string', 'pattern': '^a'}}})
+    with pytest.raises(ValueError):
+        jsonschema.compile_json_schema({'properties': {'class': {'type': 'string'}}})
+
+
+def test_compile_json_schema_types():
+    schema = jsonschema.load_json_schema({
+        'title': 'Mixed',
+        'properties': {
+            'ratio': {'type': 'number', 'maximum': 1},
+            'note': {'type': ['string', 'null']},
+            'counts': {'type': 'object', 'additionalProperties': {'type': 'integer'}},
+        },
+        'required': ['ratio'],
+    })
+    assert type(schema.bjs_all_fields['note']) is fields.StrField
+    instance = schema(ratio=0.5, note=None, counts={'a': 1})
+    assert (instance.ratio, instance.note, instance.counts) == (0.5, None, {'a': 1})
+    for invalid in [dict(ratio="0.5"), dict(ratio=2), dict(note=1), dict(counts=[]), dict(counts={'a': "1"})]:
+        with pytest.raises(ValidationError):
+            schema(**dict(dict(ratio=0.5), **invalid))
+
+
+def test_compile_json_schema_dropped_semantics():
+    for document in [
+        {'properties': {'x': {'type': 'integer'}}, 'additionalProperties': True},
+        {'properties': {'x': {'type': 'integer'}}, 'additionalProperties': {'type': 'string'}},
+        {'properties': {'x': {'type': 'integer'}}, 'required': ['x', 'y']},
+        {'properties': {'x': {'type': 'int'}}},
+        {'properties': {'x': {'type': 'array', 'items': {'type': 'integer', 'minimum': 0}}}},
+        {'properties': {'x': {'type': 'integer', 'minimum': '5'}}},
+        {'properties': {'x': {'type': 'integer', 'maximum': True}}},
+        {'properties': {'x': {'type': 'string', 'minLength': 2.0}}},
+        {'properties': {'x': {'type': 'array', 'maxItems': -1}}},
+        {'properties': {'x': {'allOf': [False]}}},
+        {'properties': {'x': False}},
+    ]:
+        with pytest.raises(ValueError):
+            jsonschema.compile_json_schema(document)
+
+
+def test_compile_json_schema_boolean_subschemas():
+    schema = jsonschema.load_json_schema({
+        'properties': {'anything': True, 'limited': {'allOf': [True, {'maximum': 5}]}},
+        'required': ['anything'],
+    })
+    assert type(schema.bjs_all_fields['anything']) is fields.BaseField
+    instance = schema(anything=("any", "value"))
+    assert instance.anything == ("any", "value") and instance.limited is None
+    with pytest.raises(ValidationError):
+        schema(anything=1, limited=6)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson import profiling
+from bluejayson.legacy import fields, validators
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+from bluejayson.validators import Range
+
+
+class Period(BaseSchema):
+    start: int = fields.IntField(sanitizer=validators.lower_bound(0))
+    end: int = fields.IntField()
+    label: str = fields.StrField(default="")
+
+    @schema_validator('start', 'end')
+    def check_order(self):
+        return self.start < self.end
+
+
+def stack_names(profiler):
+    return {stack for stack in profiler.stacks}
+
+
+def test_profiler_samples_constructions():
+    with profiling.SamplingProfiler(every=1) as profiler:
+        period = Period(start=1, end=2)
+        assert period.label == ""
+        with pytest.raises(ValidationError, match="field start"):
+            Period(start=-1, end=2)
+    assert profiling.active is None
+    # Reading the default after construction is not sampled on its own
+    assert stack_names(profiler) == {
+        'Period',
+        'Period;field:start',
+        'Period;field:start;exception',
+        'Period;schema_validator:check_order',
+    }
+    assert all(elapsed >= 0 for elapsed in profiler.stacks.values())
+
+
+def test_profiler_samples_links():
+    with profiling.SamplingProfiler(every=1, per_link=True) as profiler:
+        Period(start=1, end=2)
+        with pytest.raises(ValidationError, match="field start"):
+            Period(start=-1, end=2)
+    assert stack_names(profiler) == {
+        'Period',
+        'Period;field:start;sanitizer:Validator(cannot be less than 0)',
+        'Period;field:start;exception',
+        'Period;schema_validator:check_order',
+    }
+
+
+def test_profiler_samples_validators():
+    validator = Range(min=0)
+    with profiling.SamplingProfiler(every=2) as profiler:
+        results = [validator(value) for value in [1, -1, -1, "x"]]
+    assert results == [True, False, False, False]
+    assert stack_names(profiler) == {'Range', 'Range;passed', 'Range;failed:out_of_range'}
+
+
+def test_profiler_collapsed_output(tmp_path):
+    profiler = profiling.SamplingProfiler(every=1)
+    profiler.record('A;B', 5)
+    profiler.record('A;B', 7)
+    profiler.record('A', 1)
+    assert profiler.collapsed() == ['A 1', 'A;B 12']
+    path = tmp_path / 'stacks.txt'
+    profiler.write_collapsed(str(path))
+    assert path.read_text() == "A 1\nA;B 12\n"
+
+
+def test_profiler_single_active():
+    with profiling.SamplingProfiler():
+        with pytest.raises(RuntimeError):
+            profiling.SamplingProfiler().start()
+    with pytest.raises(ValueError):
+        profiling.SamplingProfiler(every=0)
+
+
+class Bounded(BaseSchema):
+    a: int = fields.IntField(sanitizer=validators.Validator(Range(min=0), "negative"))
+    b: int = fields.IntField(default=0)
+
+    @schema_validator('a', 'b')
+    def check_b(self):
+        return self.b <= self.a
+
+
+def test_profiler_nests_hooks_inside_sampled_calls():
+    clock = profiling.clock
+    with profiling.SamplingProfiler(every=1) as profiler:
+        started = clock()
+        Bounded(a=1)
+        elapsed = clock() - started
+    stacks = profiler.stacks
+    assert all(stack.split(';')[0] == 'Bounded' for stack in stacks)
+    assert 'Bounded;field:a;Range;passed' in stacks
+    assert 'Bounded;schema_validator:check_b;default:b' in stacks
+
+    def total(prefix):
+        return sum(weight for stack, weight in stacks.items()
+                   if stack == prefix or stack.startswith(f"{prefix};"))
+
+    for stack in stacks:
+        frames = stack.split(';')
+        for depth in range(1, len(frames)):
+            assert total(';'.join(frames[:depth + 1])) <= total(';'.join(frames[:depth]))
+    assert total('Bounded') <= elapsed
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import fields
+from bluejayson.legacy import validators as legacy_validators
+from bluejayson.legacy.columnar import SCHEMA_ERRORS, validate_columns
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+from bluejayson.validators import Equal, Length, Range, ValidationFailed
+from bluejayson.validators.reporting import ErrorCollector
+
+
+def test_collector_interning():
+    validator = Range(min=0, max=10)
+    collector = ErrorCollector(keep_values=2)
+    values = [5, 20, "x", 30, 40, -1, "y"]
+    mask = collector.validate(validator, values, start=100)
+    assert mask == [True, False, False, False, False, False, False]
+    assert len(collector) == 6
+    assert collector.summary() == [(validator, 'out_of_range', 4), (validator, 'incomparable', 2)]
+    out_of_range, incomparable = collector
+    assert list(out_of_range.rows) == [101, 103, 104, 105]
+    assert out_of_range.samples == [20, 30]
+    assert list(incomparable.rows) == [102, 106]
+
+
+def test_collector_messages():
+    validator = Range(max=10)
+    collector = ErrorCollector(keep_values=3)
+    for index in range(1000):
+        collector.add_failure(index, ValidationFailed(20 + index, validator, 'out_of_range'))
+    assert len(collector) == 1000
+    messages = collector.messages(limit=2)
+    assert messages == [(0, "value outside of range [? <= 10]"), (1, "value outside of range [? <= 10]")]
+    assert len(collector.messages()) == 3
+
+
+def test_collector_empty():
+    collector = ErrorCollector()
+    assert not collector
+    assert collector.validate(Range(min=0), [1, 2, 3]) == [True, True, True]
+    assert not collector and collector.summary() == [] and collector.messages() == []
+
+
+def test_collector_merge():
+    validator = Range(max=10)
+    first, second = ErrorCollector(keep_values=3), ErrorCollector(keep_values=3)
+    first.validate(validator, [20, 30])
+    second.validate(validator, [40, 50, 60], start=2)
+    first.merge(second)
+    (group,) = first
+    assert list(group.rows) == [0, 1, 2, 3, 4]
+    assert group.samples == [20, 30, 40]
+
+
+def test_collector_classifies_without_raising(monkeypatch):
+    def fail(self, value):
+        raise AssertionError("validate should not be called")
+
+    for validator_cls in (Range, Length, Equal):
+        monkeypatch.setattr(validator_cls, 'validate', fail)
+    collector = ErrorCollector()
+    collector.validate(Range(min=0), [-1, "x", 1])
+    collector.validate(Length(max=1), ["ab", 5, ""])
+    collector.validate(Equal(1), [1, 2])
+    assert [(group.error_code, list(group.rows)) for group in collector] == [
+        ('out_of_range', [0]), ('incomparable', [1]),
+        ('length_out_of_range', [0]), ('uncomputable_length', [1]),
+        ('not_matched', [1]),
+    ]
+
+
+def test_collector_numpy():
+    np = pytest.importorskip('numpy')
+    validator = Range(min=0)
+    collector = ErrorCollector(keep_values=2)
+    mask = collector.validate(validator, np.array([-1, 1, -2, -3]), start=10)
+    assert mask.tolist() == [False, True, False, False]
+    (group,) = collector
+    assert list(group.rows) == [10, 12, 13] and group.samples == [-1, -2]
+
+
+class Period(BaseSchema):
+    start: int = fields.IntField(sanitizer=legacy_validators.lower_bound(0))
+    end: int = fields.IntField()
+
+    @schema_validator('start', 'end')
+    def check_order(self):
+        return self.start < self.end
+
+
+def test_collector_legacy_errors():
+    collector = ErrorCollector()
+    for index, (start, end) in enumerate([(-1, 2), (3, 1), (-5, 2)]):
+        try:
+            Period(start=start, end=end)
+        except ValidationError as e:
+            collector.add_error(index, e)
+    assert collector.summary() == [
+        (None, "field start: cannot be less than 0", 2),
+        (None, "schema validator check_order: validation failed on function Period.check_order", 1),
+    ]
+    assert collector.messages(limit=1)[0] == (0, "field start: cannot be less than 0")
+
+
+def test_collector_columns():
+    result = validate_columns(Period, {'start': [-1, 3, 1], 'end': [2, 1, 2]})
+    collector = ErrorCollector()
+    collector.add_columns(result, start=100)
+    start_errors, schema_errors = collector
+    assert start_errors.validator == 'start' and list(start_errors.rows) == [100]
+    assert start_errors.samples == [-1]
+    assert schema_errors.validator == SCHEMA_ERRORS and list(schema_errors.rows) == [101]
+    assert collector.messages() == [
+        (100, "cannot be less than 0"),
+        (101, "schema validator check_order: validation failed on function Period.check_order"),
+    ]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import validators
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.sanitizers import Sanitizer, SanitizerChain
+
+
+class Strip(Sanitizer):
+    def sanitize(self, value):
+        return value.strip()
+
+
+def test_chain_flattening():
+    a, b, c = Sanitizer(), Strip(), validators.min_length(1)
+    chain = (a @ b) @ c
+    assert chain.chain == (a, b, c)
+    assert SanitizerChain([chain, a]).chain == (a, b, c, a)
+
+
+def test_chain_identity():
+    assert Sanitizer().is_identity
+    assert not Strip().is_identity
+    assert not validators.min_length(1).is_identity
+    assert (Sanitizer() @ Sanitizer()).is_identity
+    assert not (Sanitizer() @ Strip()).is_identity
+    assert (Sanitizer() @ Sanitizer())("  untouched ") == "  untouched "
+
+
+def test_chain_fused_order():
+    chain = validators.max_length(6) @ Sanitizer() @ Strip() @ validators.min_length(3)
+    assert chain(" abc  ") == "abc"
+    with pytest.raises(ValidationError, match="less than 3"):
+        chain.sanitize("  ab  ")
+    with pytest.raises(ValidationError, match="greater than 6"):
+        chain(" abcdef ")
+
+
+def test_chain_pure_check_subclass():
+    class Doubling(validators.Validator):
+        def sanitize(self, value):
+            return 2 * super().sanitize(value)
+
+    assert validators.upper_bound(5).pure_check() is not None
+    assert Doubling(lambda value: value > 0).pure_check() is None
+    chain = Doubling(lambda value: value > 0) @ validators.upper_bound(5)
+    assert chain(2) == 4
+    with pytest.raises(ValidationError):
+        chain(3)
+
+
+def test_inline_checks():
+    assert validators.upper_bound(5).inline_check('a_') == ('value <= a_max', {'a_max': 5})
+    assert validators.between(1, 5, lower_inclusive=False).inline_check('b_') == (
+        'b_min < value <= b_max', {'b_min': 1, 'b_max': 5})
+    assert validators.min_length(2).inline_check('c_') == ('len(value) >= c_min', {'c_min': 2})
+    assert validators.is_exactly("x").inline_check('d_') == ('value == d_target', {'d_target': "x"})
+    assert validators.Validator(lambda value: value > 0).inline_check('e_') is None
+
+
+def test_chain_merged_checks():
+    custom = validators.Validator(lambda value: value % 2 == 0, "should be even")
+    chain = (validators.lower_bound(0) @ custom @ validators.upper_bound(10)
+             @ Sanitizer() @ validators.is_exactly(4))
+    assert chain(4) == 4
+    for value, message in [(-2, "less than 0"), (3, "even"), (12, "greater than 10"), (6, "match 4")]:
+        with pytest.raises(ValidationError, match=message):
+            chain(value)
+    with pytest.raises(TypeError):
+        chain("x")
+
+
+def test_chain_calls_predicates_once():
+    calls = []
+
+    def check(value):
+        calls.append(value)
+        return value % 2 == 0
+
+    chain = validators.Validator(check) @ validators.upper_bound(5)
+    with pytest.raises(ValidationError):
+        chain(7)
+    assert calls == [7]
+
+
+def test_chain_matches_bare_validator_on_none_limits():
+    for validator in [validators.between(None, 10), validators.upper_bound(None),
+                      validators.max_length(None)]:
+        assert validator.constraint is None and validator.inline_check('a_') is None
+        chain = validator @ Strip()
+        for run in (validator, chain):
+            with pytest.raises(TypeError):
+                run(" 5 " if validator.description.startswith("length") else 5)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+from bluejayson.legacy import fields
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.legacy.schema import BaseSchema, schema_validator
+
+
+class Period(BaseSchema):
+    start: int = fields.IntField()
+    end: int = fields.IntField()
+    label: str = fields.StrField(default="")
+
+    @schema_validator('start', 'end', description="start must precede end")
+    def check_order(self):
+        return self.start < self.end
+
+
+def test_schema_validator_on_construction():
+    period = Period(start=1, end=2)
+    assert (period.start, period.end) == (1, 2)
+    with pytest.raises(ValidationError):
+        Period(start=3, end=2)
+
+
+def test_schema_validator_dependency_index():
+    assert Period.bjs_field_dependents['start'] == (Period.check_order,)
+    assert Period.bjs_field_dependents['end'] == (Period.check_order,)
+    assert 'label' not in Period.bjs_field_dependents
+    assert Period.bjs_affected_validators(['start', 'end']) == (Period.check_order,)
+    assert Period.bjs_affected_validators(['label']) == ()
+
+
+def test_schema_validator_on_assignment():
+    period = Period(start=1, end=2)
+    period.end = 5
+    assert period.end == 5
+    with pytest.raises(ValidationError):
+        period.start = 10
+    assert period.start == 1
+    period.label = "anything"
+    assert period.label == "anything"
+
+
+def test_schema_validator_on_bulk_update():
+    calls = []
+
+    class Tracked(Period):
+        @schema_validator('label')
+        def check_label(self):
+            calls.append(self.label)
+            return self.label != "forbidden"
+
+    period = Tracked(start=1, end=2)
+    assert calls == [""]
+    period.bjs_update(start=10, end=20)
+    assert calls == [""]
+    with pytest.raises(ValidationError):
+        period.bjs_update(end=30, label="forbidden")
+    assert (period.end, period.label) == (20, "")
+
+
+def test_schema_validator_rollback_on_other_errors():
+    period = Period(start=1, end=2)
+    with pytest.raises(TypeError):
+        period.start = None
+    assert period.start == 1
+    with pytest.raises(TypeError):
+        period.bjs_update(end=None, label="changed")
+    assert (period.end, period.label) == (2, "")
+
+
+def test_schema_validator_unknown_field():
+    with pytest.raises(TypeError):
+        class Broken(BaseSchema):
+            start: int = fields.IntField()
+
+            @schema_validator('finish')
+            def check_finish(self):
+                return True
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bluejayson.legacy import validators as legacy_validators
+from bluejayson.legacy.exceptions import ValidationError
+from bluejayson.validators import Equal, Length, Predicate, Range
+
+BUILTIN_VALIDATORS = [
+    Predicate(lambda value: value > 0),
+    Equal(42),
+    Range(min=0, max=100),
+    Length(min=1, max=8),
+]
+
+
+@pytest.mark.parametrize('validator', BUILTIN_VALIDATORS, ids=lambda v: type(v).__name__)
+def test_builtin_validators_are_frozen(validator):
+    field = dataclasses.fields(validator)[0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(validator, field.name, None)
+    assert hash(validator) == hash(dataclasses.replace(validator))
+
+
+def test_shared_validators_across_threads():
+    numbers = list(range(-50, 150)) * 10
+    strings = ["", "blue", "bluejays", "mockingbird"] * 500
+    cases = [
+        (BUILTIN_VALIDATORS[0], numbers),
+        (BUILTIN_VALIDATORS[1], numbers),
+        (BUILTIN_VALIDATORS[2], numbers),
+        (BUILTIN_VALIDATORS[3], strings),
+        (legacy_validators.lower_bound(0) @ legacy_validators.upper_bound(100), numbers),
+    ]
+
+    def run(validator, values):
+        return [_passes(validator, value) for value in values]
+
+    expected = [run(validator, values) for validator, values in cases]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(4):
+            futures = [executor.submit(run, validator, values) for validator, values in cases]
+            assert [future.result() for future in futures] == expected
+
+
+def _passes(validator, value) -> bool:
+    try:
+        return validator(value) is not False
+    except ValidationError:
+        return False